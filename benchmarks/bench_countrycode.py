@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+国家代码转换性能基准
+
+覆盖 countrycode 模块的主要转换路径，结果以 JSON 输出，
+并可与基准结果比较，任一路径变慢超过给定倍数时以非零状态退出。
+
+用法:
+    # 运行并保存结果
+    python benchmarks/bench_countrycode.py --output bench_countrycode.json
+
+    # 与已保存的基准比较，变慢超过 1.5 倍即失败
+    python benchmarks/bench_countrycode.py --baseline bench_countrycode.json --max-ratio 1.5
+
+    # 只运行部分用例、调整规模
+    python benchmarks/bench_countrycode.py --only convert_list --sizes 1000 100000
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+
+from simtoolsz.countrycode import CountryCode, _load_reference, country_convert
+
+CODES = ["CHN", "USA", "JPN", "DEU", "FRA", "GBR", "IND", "BRA", "ZZZ"]
+NAMES = [
+    "People's Republic of China",
+    "United States of America",
+    "Japan",
+    "Federal Republic of Germany",
+    "Viet Nam",
+    "Unknown Land",
+]
+
+
+def _repeat_to(values: list, size: int) -> list:
+    """将样本值循环扩展到指定长度。"""
+    return (values * (size // len(values) + 1))[:size]
+
+
+def _construct_cold() -> CountryCode:
+    """清空参考表缓存后构造，测量读取参考表的冷启动耗时。"""
+    _load_reference.cache_clear()
+    return CountryCode()
+
+
+def build_cases(sizes: list[int]) -> dict[str, Callable[[], object]]:
+    """
+    构造全部基准用例。
+
+    Args:
+        sizes: 批量转换用例的输入规模
+
+    Returns:
+        dict[str, Callable[[], object]]: {用例名: 无参可调用对象}
+    """
+    cc = CountryCode()
+    cases: dict[str, Callable[[], object]] = {
+        "construct": lambda: CountryCode(),
+        "construct_cold": _construct_cold,
+        "convert_single": lambda: cc.convert("CHN", source="ISO3"),
+        "convert_single_auto": lambda: cc.convert("CN"),
+        "convert_regex": lambda: [cc.convert(n, use_regex=True) for n in NAMES],
+    }
+    for size in sizes:
+        codes = _repeat_to(CODES, size)
+        series = pl.Series("ISO3", codes)
+        frame = pl.DataFrame({"ISO3": codes})
+        cases[f"convert_list_{size}"] = lambda c=codes: cc.convert(c, source="ISO3")
+        cases[f"covert_series_{size}"] = lambda s=series: cc.covert_series(
+            s, source="ISO3", out_type="list"
+        )
+        cases[f"convert_frame_{size}"] = lambda f=frame: cc.convert_frame(f, "ISO3")
+        cases[f"country_convert_frame_{size}"] = lambda f=frame: country_convert(
+            f, src="ISO3"
+        )
+    return cases
+
+
+def run_case(func: Callable[[], object], repeat: int, min_time: float) -> float:
+    """
+    测量单个用例，返回单次调用的最短耗时（秒）。
+
+    每轮调用次数自动放大到总耗时不少于 min_time，取多轮中的最小值以降低噪声。
+    """
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], max_ratio: float
+) -> list[str]:
+    """
+    与基准结果比较，返回变慢超过阈值的用例说明。
+    """
+    regressions = []
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = seconds / base
+        if ratio > max_ratio:
+            regressions.append(
+                f"{name}: {seconds:.6g}s，基准 {base:.6g}s，变慢 {ratio:.2f} 倍"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="countrycode 性能基准")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 100_000, 1_000_000],
+        help="批量转换用例的输入规模",
+    )
+    parser.add_argument("--only", nargs="+", help="只运行名称以这些前缀开头的用例")
+    parser.add_argument("--repeat", type=int, default=5, help="每个用例的测量轮数")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="每轮的最短测量时间（秒）"
+    )
+    parser.add_argument("--output", type=Path, help="结果 JSON 的输出路径")
+    parser.add_argument("--baseline", type=Path, help="用于比较的基准结果 JSON")
+    parser.add_argument(
+        "--max-ratio", type=float, default=1.5, help="允许的最大变慢倍数"
+    )
+    args = parser.parse_args(argv)
+
+    cases = build_cases(args.sizes)
+    if args.only:
+        cases = {
+            k: v for k, v in cases.items() if any(k.startswith(p) for p in args.only)
+        }
+
+    results = {}
+    for name, func in cases.items():
+        results[name] = run_case(func, args.repeat, args.min_time)
+        print(f"{name:<36} {results[name] * 1e3:>12.4f} ms")
+
+    report = {
+        "python": platform.python_version(),
+        "polars": pl.__version__,
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n结果已写入 {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline.get("results", {}), args.max_ratio)
+        if regressions:
+            print(f"\n以下用例变慢超过 {args.max_ratio} 倍:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\n所有用例均未超过 {args.max_ratio} 倍阈值")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
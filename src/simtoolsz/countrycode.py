@@ -8,6 +8,7 @@
     - CountryCode: 国家代码转换器类
     - country_convert: 快捷转换函数
     - is_data_container: 判断对象是否为数据容器
+    - build_reference_artifact: 生成可内存映射的代码表文件，加快启动
 
 支持的国家代码格式:
     - ISO2: 两位字母代码 (如 CN, US)
@@ -23,13 +24,20 @@
 
 import re
 import json
+import hashlib
+import threading
 import polars as pl
 
 from pathlib import Path
-from functools import reduce
+from functools import cached_property, lru_cache
 from typing import Any, Iterable
 
-__all__ = ["CountryCode", "is_data_container", "country_convert"]
+__all__ = [
+    "CountryCode",
+    "is_data_container",
+    "country_convert",
+    "build_reference_artifact",
+]
 
 
 UNIQUE_IDS = [
@@ -41,7 +49,13 @@ UNIQUE_IDS = [
     "name_official",
 ]
 
+INDEX_COLUMNS = UNIQUE_IDS + ["ISOnumeric", "UNcode", "FAOcode"]
+
 codedata = Path(__file__).parent.resolve() / "country.parquet"
+codeartifact = Path(__file__).parent.resolve() / "country.arrow"
+
+# Arrow IPC 文件的 schema 元数据中记录其来源 parquet 指纹的键
+_ARTIFACT_SOURCE_KEY = b"simtoolsz:source"
 infodata = Path(__file__).parent.resolve() / "columns_info"
 
 valid_trans = {
@@ -72,6 +86,526 @@ valid_trans = {
     "EXIO3": ["exio_hybrid_3", "exio_hybrid_3_cons"],
 }
 
+# 全部别名（保持原始写法），以及 大小写折叠后的名称/别名 -> 标准名称 的映射
+ALIAS_NAMES = [alias for aliases in valid_trans.values() for alias in aliases]
+_ALIASES = {
+    name.casefold(): canonical
+    for canonical, aliases in valid_trans.items()
+    for name in [canonical, *aliases]
+}
+
+
+def _guess_single(xc: int | str) -> str:
+    """
+    识别单个国家代码的格式类型，规则见 ``CountryCode._guess_source``。
+
+    Args:
+        xc: 输入的国家代码
+
+    Returns:
+        str: 识别出的格式类型
+    """
+    try:
+        int(xc)
+        return "ISOnumeric"
+    except ValueError:
+        if len(str(xc)) == 2:
+            return "ISO2"
+        elif len(str(xc)) == 3:
+            return "ISO3"
+        else:
+            return "regex"
+
+
+AUTO_SOURCES = ["ISOnumeric", "ISO2", "ISO3", "regex"]
+
+# 模糊匹配使用的名称列
+FUZZY_COLUMNS = ["name_short", "name_zh", "name_official"]
+
+
+def _guess_expr(code: pl.Expr, dtype: pl.DataType | None = None) -> pl.Expr:
+    """
+    ``_guess_single`` 的向量化版本，对整列输出识别出的格式类型。
+
+    Args:
+        code: 国家代码列的表达式
+        dtype: 该列的数据类型，数值列（如含缺失值的整数列读成的浮点列）
+               与 ``_guess_single`` 一致，整列识别为 ISOnumeric
+
+    Returns:
+        pl.Expr: 取值为 ``AUTO_SOURCES`` 之一的字符串列
+    """
+    if dtype is not None and dtype.is_numeric():
+        return pl.lit("ISOnumeric")
+    text = code.cast(pl.String)
+    return (
+        pl.when(text.str.contains(r"^\s*[+-]?\d+\s*$"))
+        .then(pl.lit("ISOnumeric"))
+        .when(text.str.len_chars() == 2)
+        .then(pl.lit("ISO2"))
+        .when(text.str.len_chars() == 3)
+        .then(pl.lit("ISO3"))
+        .otherwise(pl.lit("regex"))
+    )
+
+
+def _integer_key(code: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+    """
+    将列转换为整数查找键，规则与 ``CountryCode._normalize_key`` 一致。
+
+    字符串去掉首尾空白后转换；浮点数只接受整数值（156.0 -> 156，156.5 为空值），
+    不会被截断为相邻的代码。
+
+    Args:
+        code: 国家代码列的表达式
+        dtype: 该列的数据类型
+
+    Returns:
+        pl.Expr: Int64 类型的查找键，无法转换时为空值
+    """
+    if dtype.is_float():
+        return pl.when(code == code.floor()).then(code.cast(pl.Int64, strict=False))
+    if dtype.is_integer():
+        return code.cast(pl.Int64, strict=False)
+    return code.cast(pl.String).str.strip_chars().cast(pl.Int64, strict=False)
+
+
+def _build_index(values: list[Any]) -> dict[Any, list[int]]:
+    """
+    为一列数据建立 值 -> 行号列表 的哈希索引。
+
+    空值不进入索引；同一个值出现在多行时按行号顺序全部保留。
+
+    Args:
+        values: 列数据
+
+    Returns:
+        dict[Any, list[int]]: 值到行号列表的映射
+    """
+    index: dict[Any, list[int]] = {}
+    for i, value in enumerate(values):
+        if value is not None:
+            index.setdefault(value, []).append(i)
+    return index
+
+
+# 输入不少于该数量时，批量转换整列交给 Polars 多线程引擎完成
+BULK_MIN_SIZE = 10_000
+
+_SHARED_MAXSIZE = 16
+_shared_converters: dict[Any, "CountryCode"] = {}
+_shared_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _load_columns_info() -> dict[str, str]:
+    """
+    读取各代码类别的说明信息，同一进程内只读取一次。
+
+    Returns:
+        dict[str, str]: {类别名称: 说明}
+    """
+    with open(infodata, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_reference_artifact(dest: Path | None = None) -> Path:
+    """
+    将国家代码数据生成为未压缩的 Arrow IPC 文件。
+
+    该文件可以被内存映射，加载时无需解码，适合启动频繁的短任务。
+    schema 元数据中记录了来源 parquet 的大小与哈希，写入默认位置后，
+    ``CountryCode`` 只在它与当前 parquet 的内容一致时使用它。
+    打包发布前执行一次即可。
+
+    Args:
+        dest: 输出路径，默认为包目录下的 country.arrow
+
+    Returns:
+        Path: 生成的文件路径
+
+    Examples:
+        >>> build_reference_artifact()
+        PosixPath('.../simtoolsz/country.arrow')
+    """
+    import pyarrow as pa
+
+    dest = Path(dest) if dest is not None else codeartifact
+    table = pl.read_parquet(codedata).to_arrow()
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), _ARTIFACT_SOURCE_KEY: _source_fingerprint()}
+    )
+    with pa.OSFile(str(dest), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return dest
+
+
+def _source_fingerprint(source: Path | None = None) -> bytes:
+    """
+    返回 parquet 文件的指纹（大小与 SHA-256）。
+
+    Args:
+        source: parquet 文件路径，默认为包内的 country.parquet
+
+    Returns:
+        bytes: 形如 ``b"大小:哈希"`` 的指纹
+    """
+    content = Path(source if source is not None else codedata).read_bytes()
+    return f"{len(content)}:{hashlib.sha256(content).hexdigest()}".encode()
+
+
+def _artifact_is_current(
+    artifact: Path | None = None, source: Path | None = None
+) -> bool:
+    """
+    判断 Arrow IPC 文件是否由当前的 parquet 生成。
+
+    比较文件内容而不是修改时间：安装 wheel 时文件的修改时间取决于解压顺序，
+    不能说明新旧。
+
+    Args:
+        artifact: Arrow IPC 文件路径，默认为包内的 country.arrow
+        source: parquet 文件路径，默认为包内的 country.parquet
+
+    Returns:
+        bool: 文件存在且记录的指纹与 parquet 一致时为 True
+    """
+    import pyarrow as pa
+
+    artifact = Path(artifact if artifact is not None else codeartifact)
+    if not artifact.exists():
+        return False
+    try:
+        with pa.memory_map(str(artifact)) as f:
+            metadata = pa.ipc.open_file(f).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+    return metadata.get(_ARTIFACT_SOURCE_KEY) == _source_fingerprint(source)
+
+
+@lru_cache(maxsize=1)
+def _load_reference() -> pl.DataFrame:
+    """
+    读取国家代码数据，同一进程内只读取一次。
+
+    存在由当前 parquet 生成的 Arrow IPC 文件时以内存映射方式读取，否则读取 parquet。
+
+    Returns:
+        pl.DataFrame: 国家代码数据
+    """
+    if _artifact_is_current():
+        return pl.read_ipc(codeartifact, memory_map=True)
+    return pl.read_parquet(codedata)
+
+
+def _as_frame(additional_data: Any) -> pl.DataFrame:
+    """
+    将额外数据规范化为 polars DataFrame。
+
+    Args:
+        additional_data: dict、polars DataFrame 或 pandas DataFrame
+
+    Returns:
+        pl.DataFrame: 规范化后的数据
+
+    Raises:
+        ValueError: 当数据类型不受支持时
+    """
+    if isinstance(additional_data, pl.DataFrame):
+        return additional_data
+    if isinstance(additional_data, dict):
+        return pl.DataFrame(additional_data)
+    if hasattr(additional_data, "to_dict") and hasattr(additional_data, "columns"):
+        return pl.from_pandas(additional_data)
+    raise ValueError(
+        f"不支持的额外数据类型 {type(additional_data).__name__}，"
+        "请使用 dict、polars DataFrame 或 pandas DataFrame"
+    )
+
+
+def _merge_additional(frame: pl.DataFrame, extra: pl.DataFrame) -> pl.DataFrame:
+    """
+    将额外数据合并进国家代码数据。
+
+    额外数据的每一行按 ``INDEX_COLUMNS`` 中的标识列匹配已有记录：
+    匹配到时补充该记录的空值字段，未匹配到时作为新记录追加；
+    额外数据中新增的列会被加入代码表。
+
+    以下情况视为冲突并抛出异常:
+        - 同一行的不同标识列指向不同的国家
+        - 额外数据的取值与已有记录的非空取值不一致
+        - 某一行不包含任何标识值
+
+    Args:
+        frame: 国家代码数据
+        extra: 额外数据
+
+    Returns:
+        pl.DataFrame: 合并后的数据
+
+    Raises:
+        ValueError: 当缺少标识列、类型不兼容或存在冲突时
+    """
+    keys = [c for c in INDEX_COLUMNS if c in extra.columns]
+    if not keys:
+        raise ValueError(f"额外数据至少需要包含以下列之一: {', '.join(INDEX_COLUMNS)}")
+    try:
+        extra = extra.with_columns(
+            pl.col(c).cast(frame.schema[c]) for c in extra.columns if c in frame.schema
+        )
+    except pl.exceptions.PolarsError as e:
+        raise ValueError(f"额外数据的列类型与国家代码数据不兼容: {e}")
+
+    data = frame.to_dict(as_series=False)
+    for col in extra.columns:
+        data.setdefault(col, [None] * frame.height)
+    index = {c: _build_index(data[c]) for c in keys}
+    conflicts = []
+
+    for i, record in enumerate(extra.iter_rows(named=True)):
+        present = [c for c in keys if record[c] is not None]
+        if not present:
+            conflicts.append(f"第 {i} 行: 没有任何标识值")
+            continue
+        matched = [set(index[c][record[c]]) for c in present if record[c] in index[c]]
+        if any(rows != matched[0] for rows in matched[1:]):
+            conflicts.append(f"第 {i} 行: 标识列指向不同的国家 {record}")
+            continue
+
+        if matched:
+            rows = sorted(matched[0])
+        else:
+            rows = [len(data[keys[0]])]
+            for col in data:
+                data[col].append(None)
+
+        for row in rows:
+            for col, value in record.items():
+                if value is None:
+                    continue
+                current = data[col][row]
+                if current is None:
+                    data[col][row] = value
+                    if col in index:
+                        index[col].setdefault(value, []).append(row)
+                elif current != value:
+                    conflicts.append(
+                        f"第 {i} 行: {col} 取值 {value!r} 与已有的 {current!r} 冲突"
+                    )
+
+    if conflicts:
+        raise ValueError("额外数据与国家代码数据冲突:\n" + "\n".join(conflicts))
+
+    schema = dict(frame.schema)
+    schema.update({c: extra.schema[c] for c in extra.columns if c not in schema})
+    return pl.DataFrame(data, schema=schema)
+
+
+def _fingerprint(additional_data: Any) -> Any:
+    """
+    计算额外数据的指纹，用作共享转换器的缓存键。
+
+    DataFrame 与字典按内容计算指纹；其他对象按标识计算，
+    缓存中的转换器持有该对象的引用，因此标识不会被复用。
+
+    Args:
+        additional_data: 额外的自定义数据
+
+    Returns:
+        Any: 可哈希的指纹
+    """
+    if additional_data is None:
+        return None
+    if isinstance(additional_data, dict):
+        return ("dict", json.dumps(additional_data, sort_keys=True, default=str))
+    if not isinstance(additional_data, pl.DataFrame) and hasattr(
+        additional_data, "to_dict"
+    ):
+        additional_data = pl.from_pandas(additional_data)
+    if isinstance(additional_data, pl.DataFrame):
+        return (
+            "frame",
+            tuple(additional_data.schema.items()),
+            tuple(additional_data.hash_rows().to_list()),
+        )
+    return ("id", id(additional_data))
+
+
+# 忽略大小写时与 ASCII 字母等价的非 ASCII 字符，预筛选前先映射为对应字母
+_CASE_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """返回从 ``[`` 开始的字符集之后的位置。"""
+    j = i + 1
+    if j < len(pattern) and pattern[j] == "^":
+        j += 1
+    if j < len(pattern) and pattern[j] == "]":
+        j += 1
+    while j < len(pattern) and pattern[j] != "]":
+        j += 2 if pattern[j] == "\\" else 1
+    return j + 1
+
+
+def _split_branches(pattern: str) -> list[str]:
+    """按顶层的 ``|`` 拆分正则表达式。"""
+    branches, depth, start, i = [], 0, 0, 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            i = _skip_class(pattern, i)
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            branches.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    branches.append(pattern[start:])
+    return branches
+
+
+def _branch_literal(branch: str) -> str:
+    """返回分支中必然出现的最长 ASCII 字面量（小写），没有时返回空字符串。"""
+    runs, cur, depth, i = [], "", 0, 0
+    while i < len(branch):
+        ch = branch[i]
+        if ch == "\\" or ch in "[(+.^$" or not ch.isascii():
+            runs.append(cur)
+            cur = ""
+            if ch == "\\":
+                i += 1
+            elif ch == "[":
+                i = _skip_class(branch, i)
+                continue
+            elif ch == "(":
+                depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif depth == 0 and ch in "?*{":
+            runs.append(cur[:-1])
+            cur = ""
+            if ch == "{":
+                close = branch.find("}", i)
+                i = len(branch) if close == -1 else close
+        elif depth == 0:
+            cur += ch
+        i += 1
+    runs.append(cur)
+    return max(runs, key=len).lower()
+
+
+class _RegexIndex:
+    """
+    国家名称正则表达式的匹配索引。
+
+    对每个正则表达式，提取其每个顶层分支中必然出现的字面量作为关键词。
+    查找时先用关键词对输入做一次子串预筛选，只对候选行执行正则匹配；
+    无法提取关键词的表达式总是参与匹配。结果与逐个 ``search`` 完全一致。
+    """
+
+    def __init__(self, patterns: list[str | None]) -> None:
+        self._patterns: dict[int, re.Pattern] = {}
+        self._keywords: dict[str, list[int]] = {}
+        self._always: list[int] = []
+        for row, entry in enumerate(patterns):
+            if entry is None:
+                continue
+            self._patterns[row] = re.compile(entry, re.IGNORECASE)
+            literals = [_branch_literal(b) for b in _split_branches(entry)]
+            if all(literals):
+                for literal in dict.fromkeys(literals):
+                    self._keywords.setdefault(literal, []).append(row)
+            else:
+                self._always.append(row)
+
+    def find(self, txt: str) -> list[int]:
+        """
+        返回与输入匹配的全部行号（按行号排序）。
+
+        Args:
+            txt: 输入文本
+
+        Returns:
+            list[int]: 匹配的行号列表
+        """
+        folded = txt.translate(_CASE_FOLD).lower()
+        candidates = set(self._always)
+        for keyword, rows in self._keywords.items():
+            if keyword in folded:
+                candidates.update(rows)
+        return [row for row in sorted(candidates) if self._patterns[row].search(txt)]
+
+
+def _ngrams(text: str, n: int = 2) -> set[str]:
+    """
+    返回文本规范化后的字符 n-gram 集合。
+
+    规范化包括大小写折叠、将标点与连续空白合并为单个空格，
+    并在首尾补空格，使词首词尾也形成 n-gram。
+    """
+    norm = " ".join(
+        re.sub(r"[\W_]+", " ", text.translate(_CASE_FOLD).casefold()).split()
+    )
+    if not norm:
+        return set()
+    padded = f" {norm} "
+    return {padded[i : i + n] for i in range(len(padded) - n + 1)}
+
+
+class _FuzzyIndex:
+    """
+    国家名称的 n-gram 倒排索引，用于容错的模糊匹配。
+
+    每个名称拆分为字符二元组（bigram），以 gram -> 名称编号 建立倒排表。
+    查询时只累计与输入共享 gram 的名称，按 Dice 系数
+    ``2 * |A ∩ B| / (|A| + |B|)`` 打分，无需与全部名称逐一比较。
+    """
+
+    def __init__(self, names: list[tuple[int, str]]) -> None:
+        self._rows: list[int] = []
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        for row, name in names:
+            grams = _ngrams(name)
+            if not grams:
+                continue
+            entry = len(self._rows)
+            self._rows.append(row)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(entry)
+
+    def best(self, txt: str) -> tuple[int | None, float]:
+        """
+        返回与输入最相似的行号及其得分。
+
+        Args:
+            txt: 输入文本
+
+        Returns:
+            tuple[int | None, float]: (行号, 得分)，得分在 0 到 1 之间；
+            没有共享任何 gram 时返回 (None, 0.0)
+        """
+        grams = _ngrams(txt)
+        overlap: dict[int, int] = {}
+        for gram in grams:
+            for entry in self._postings.get(gram, ()):
+                overlap[entry] = overlap.get(entry, 0) + 1
+        best_row, best_score = None, 0.0
+        for entry, common in overlap.items():
+            score = 2 * common / (len(grams) + self._sizes[entry])
+            row = self._rows[entry]
+            if score > best_score or (score == best_score and row < best_row):
+                best_row, best_score = row, score
+        return best_row, best_score
+
 
 def is_data_container(data: Any) -> bool:
     """
@@ -107,12 +641,18 @@ class CountryCode:
 
     提供各种国家代码格式之间的转换功能，支持自动识别输入格式和正则表达式匹配。
 
+    线程安全：实例在构造完成后不可修改（赋值或删除属性会抛出 AttributeError），
+    可在多个线程间共享同一个实例。索引、正则和列数据等内部缓存在首次使用时建立，
+    并发建立时可能重复计算，但结果相同，不影响正确性；结果缓存使用线程安全的
+    ``lru_cache``。批量转换（``convert_frame``，以及精确匹配下的
+    ``covert_series``/``country_convert``）由 Polars 引擎执行，
+    执行期间释放 GIL，可随 CPU 核数扩展。
+
     Attributes:
+        _frame: 国家代码数据的 DataFrame（构造时一次性读入内存）
         _data: 国家代码数据的 LazyFrame
-        _add_data: 额外的自定义数据
-        _reges: 用于正则匹配的模式列表
-        _reges_ISO2: ISO2 代码的正则模式列表
-        _reges_ISO3: ISO3 代码的正则模式列表
+        _add_data: 额外的自定义数据（原始输入，已合并进 _frame）
+        _index: 精确查找用的哈希索引，{列名: {值: [行号, ...]}}，按列在首次查找时建立
 
     Examples:
         >>> cc = CountryCode()
@@ -122,32 +662,129 @@ class CountryCode:
         'CN'
     """
 
-    def __init__(self, additional_data: Any = None) -> None:
+    def __init__(
+        self, additional_data: Any = None, cache_size: int | None = None
+    ) -> None:
         """
         初始化转换器。
 
         Args:
-            additional_data: 额外的自定义数据，用于扩展国家代码数据库
+            additional_data: 额外的自定义数据，用于扩展国家代码数据库。
+                             支持 dict、polars DataFrame 或 pandas DataFrame，
+                             需至少包含 ``INDEX_COLUMNS`` 中的一个标识列；
+                             构造时合并进代码表并建立索引，新增的列同样可作为源/目标格式
+            cache_size: 转换结果 LRU 缓存的容量，默认 None 即不缓存。
+                        输入高度重复时开启可显著加速，缓存键为
+                        (code, source, target, use_regex)，格式自动识别同样被缓存
         """
-        self._data = pl.scan_parquet(codedata)
+        self._frame = _load_reference()
         self._add_data = additional_data
+        index_columns = list(INDEX_COLUMNS)
+        if additional_data is not None:
+            extra = _as_frame(additional_data)
+            index_columns += [c for c in extra.columns if c not in self._frame.schema]
+            self._frame = _merge_additional(self._frame, extra)
+        self._data = self._frame.lazy()
+        self._columns: dict[str, list[Any]] = {}
+        self._names = {col.casefold(): col for col in self._frame.columns}
+        self._matchers: dict[str, _RegexIndex] = {}
+
+        self._index_columns = index_columns
+        self._index: dict[str, dict[Any, list[int]]] = {}
+
+        if cache_size:
+            self._lookup = lru_cache(maxsize=cache_size)(self._lookup_uncached)
+            self._guess = lru_cache(maxsize=cache_size)(_guess_single)
+        else:
+            self._lookup = self._lookup_uncached
+            self._guess = _guess_single
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"CountryCode 实例构造后不可修改：{name}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"CountryCode 实例构造后不可修改：{name}")
+        super().__delattr__(name)
+
+    @classmethod
+    def shared(
+        cls, additional_data: Any = None, cache_size: int | None = None
+    ) -> "CountryCode":
+        """
+        获取进程内共享的转换器实例。
 
-        regex_list = self._data.select(pl.col("regex")).collect()["regex"].to_list()
-        self._reges = [
-            re.compile(entry, re.IGNORECASE)
-            for entry in regex_list
-            if entry is not None
-        ]
+        相同的额外数据（按内容指纹判断）复用同一个实例，
+        避免重复读取代码表和建立索引。
 
-        iso2_list = self._data.select(pl.col("ISO2")).collect()["ISO2"].to_list()
-        self._reges_ISO2 = [
-            re.compile(entry, re.IGNORECASE) for entry in iso2_list if entry is not None
-        ]
+        Args:
+            additional_data: 额外的自定义数据
+            cache_size: 转换结果 LRU 缓存的容量，默认不缓存
 
-        iso3_list = self._data.select(pl.col("ISO3")).collect()["ISO3"].to_list()
-        self._reges_ISO3 = [
-            re.compile(entry, re.IGNORECASE) for entry in iso3_list if entry is not None
-        ]
+        Returns:
+            CountryCode: 共享的转换器实例
+
+        Examples:
+            >>> CountryCode.shared() is CountryCode.shared()
+            True
+        """
+        key = (_fingerprint(additional_data), cache_size)
+        with _shared_lock:
+            converter = _shared_converters.get(key)
+            if converter is None:
+                converter = cls(additional_data, cache_size)
+                if len(_shared_converters) >= _SHARED_MAXSIZE:
+                    _shared_converters.pop(next(iter(_shared_converters)))
+                _shared_converters[key] = converter
+        return converter
+
+    def cache_info(self) -> dict[str, Any]:
+        """
+        获取转换结果缓存的命中统计。
+
+        Returns:
+            dict[str, Any]: {"convert": CacheInfo, "guess_source": CacheInfo}，
+                            未开启缓存时返回空字典
+
+        Examples:
+            >>> cc = CountryCode(cache_size=1024)
+            >>> cc.convert(["CHN", "CHN"], source="ISO3")
+            ['中国', '中国']
+            >>> cc.cache_info()["convert"].hits
+            1
+        """
+        if not hasattr(self._lookup, "cache_info"):
+            return {}
+        return {
+            "convert": self._lookup.cache_info(),
+            "guess_source": self._guess.cache_info(),
+        }
+
+    def cache_clear(self) -> None:
+        """清空转换结果缓存及其统计。"""
+        if hasattr(self._lookup, "cache_clear"):
+            self._lookup.cache_clear()
+            self._guess.cache_clear()
+
+    @cached_property
+    def _schema(self) -> pl.Schema:
+        """国家代码数据的列类型（缓存，DataFrame.schema 每次访问都会重新构造）。"""
+        return self._frame.schema
+
+    @cached_property
+    def _fuzzy(self) -> _FuzzyIndex:
+        """名称列的 n-gram 模糊匹配索引（首次访问时建立）。"""
+        return _FuzzyIndex(
+            [
+                (row, name)
+                for col in FUZZY_COLUMNS
+                for row, name in enumerate(self._column(col))
+                if name is not None
+            ]
+        )
 
     @property
     def all_valid_class(self) -> list[str]:
@@ -157,21 +794,17 @@ class CountryCode:
         Returns:
             list[str]: 所有有效类别名称的列表
         """
-        datcol = self._data.collect_schema().names()
-        datcol = datcol + reduce(lambda x, y: x + y, valid_trans.values())
-        if self._add_data is not None:
-            datcol = datcol + self._add_data.columns
-        return datcol
+        return self.core_valid_class + ALIAS_NAMES
 
     @property
     def core_valid_class(self) -> list[str]:
         """
-        获取核心代码类别名称（不包括别名）。
+        获取核心代码类别名称（不包括别名，包括额外数据中新增的列）。
 
         Returns:
             list[str]: 核心类别名称的列表
         """
-        return self._data.collect_schema().names()
+        return list(self._frame.columns)
 
     @staticmethod
     def search_info(colname: str) -> str:
@@ -188,14 +821,13 @@ class CountryCode:
             >>> CountryCode.search_info("ISO2")
             '两位字母国家代码...'
         """
-        with open(infodata, "r", encoding="utf-8") as f:
-            colinf = json.load(f)
-        for k, v in valid_trans.items():
-            if colname in v:
-                return colinf.get(k, f"未找到关于 {colname} 的信息")
+        colinf = _load_columns_info()
+        if colname in colinf:
+            return colinf[colname]
         if colname.lower() == "all":
             return ", ".join(colinf.keys())
-        return colinf.get(colname, f"未找到关于 {colname} 的信息")
+        key = _ALIASES.get(colname.casefold(), colname)
+        return colinf.get(key, f"未找到关于 {colname} 的信息")
 
     @staticmethod
     def _guess_source(code: int | str | Iterable[str | int]) -> str | list[str]:
@@ -214,19 +846,6 @@ class CountryCode:
         Returns:
             str | list[str]: 识别出的格式类型
         """
-
-        def _guess_single(xc: int | str) -> str:
-            try:
-                int(xc)
-                return "ISOnumeric"
-            except ValueError:
-                if len(str(xc)) == 2:
-                    return "ISO2"
-                elif len(str(xc)) == 3:
-                    return "ISO3"
-                else:
-                    return "regex"
-
         if isinstance(code, str) or isinstance(code, int):
             return _guess_single(code)
         else:
@@ -240,6 +859,8 @@ class CountryCode:
         """
         将代码类别名称或别名转换为标准名称。
 
+        解析顺序: 与数据列完全同名 > 别名（不区分大小写）> 数据列（不区分大小写）。
+
         Args:
             src: 输入的类别名称或别名
 
@@ -249,48 +870,102 @@ class CountryCode:
         Raises:
             ValueError: 当输入无法识别时抛出
         """
-        original_src = src
-        lower_src = src.lower()
+        if src in self._schema:
+            return src
+        folded = src.casefold()
+        if folded in _ALIASES:
+            return _ALIASES[folded]
+        if folded in self._names:
+            return self._names[folded]
+        raise ValueError(f"无法识别的参数 {src}")
+
+    def _column(self, colname: str) -> list[Any]:
+        """
+        以 Python 列表形式获取某一列的数据（首次访问后缓存）。
 
-        for k, v in valid_trans.items():
-            if lower_src in [alias.lower() for alias in v]:
-                src = k
-                break
+        Args:
+            colname: 列名
 
-        if src in valid_trans or src in self.core_valid_class:
-            return src
+        Returns:
+            list[Any]: 该列的全部取值
+        """
+        values = self._columns.get(colname)
+        if values is None:
+            values = self._columns.setdefault(colname, self._frame[colname].to_list())
+        return values
+
+    def _normalize_key(self, txt: str | int, colname: str) -> str | int:
+        """
+        将查找值转换为与列类型一致的键，如数字列中的 "156" 转为 156。
+
+        Args:
+            txt: 要查找的值
+            colname: 查找的列名
 
-        if original_src in self.core_valid_class:
-            return original_src
+        Returns:
+            str | int: 规范化后的查找键
+        """
+        dtype = self._schema.get(colname)
+        if (
+            isinstance(txt, str)
+            and dtype is not None
+            and dtype.is_integer()
+            and re.fullmatch(r"\s*[+-]?\d+\s*", txt, re.ASCII)
+        ):
+            return int(txt)
+        return txt
+
+    def _find_rows(
+        self, txt: str | int, colname: str, use_regex: bool = False
+    ) -> list[int]:
+        """
+        查找匹配记录的行号。
 
-        lower_case_valid_class = [et.lower() for et in self.core_valid_class]
-        if lower_src in lower_case_valid_class:
-            return self.core_valid_class[lower_case_valid_class.index(lower_src)]
+        精确查找优先使用哈希索引（每列首次查找时建立），时间复杂度为 O(1)。
 
-        for k in valid_trans:
-            if lower_src == k.lower():
-                return k
+        Args:
+            txt: 要查找的值
+            colname: 查找的列名
+            use_regex: 是否使用正则表达式匹配
 
-        raise ValueError(f"无法识别的参数 {original_src}")
+        Returns:
+            list[int]: 匹配记录的行号列表
+        """
+        if use_regex:
+            return self._regex_rows(txt, colname)
+        key = self._normalize_key(txt, colname)
+        if colname in self._index_columns:
+            index = self._index.get(colname)
+            if index is None:
+                index = self._index.setdefault(
+                    colname, _build_index(self._column(colname))
+                )
+            return index.get(key, [])
+        return [i for i, value in enumerate(self._column(colname)) if value == key]
 
-    def _which_regex(self, colname: str) -> list[re.Pattern] | None:
+    def _regex_rows(self, txt: str | int, colname: str) -> list[int]:
         """
-        根据列名返回对应的正则表达式列表。
+        使用正则匹配索引查找匹配的行号。
+
+        各列的索引在首次使用时构建并缓存。
 
         Args:
-            colname: 列名
+            txt: 要查找的值
+            colname: 查找的列名
 
         Returns:
-            list[re.Pattern] | None: 正则表达式列表，不支持的列名返回 None
-        """
-        if colname == "ISO2":
-            return self._reges_ISO2
-        elif colname == "ISO3":
-            return self._reges_ISO3
-        elif colname in ["regex", "name_short"]:
-            return self._reges
-        else:
-            return None
+            list[int]: 匹配记录的行号列表，不支持正则匹配的列返回空列表
+        """
+        if colname in ["regex", "name_short"]:
+            colname = "regex"
+        elif colname not in ["ISO2", "ISO3"]:
+            return []
+        matcher = self._matchers.get(colname)
+        if matcher is None:
+            matcher = self._matchers.setdefault(
+                colname, _RegexIndex(self._column(colname))
+            )
+        return matcher.find(str(txt))
 
     def _lazy_find(
         self, txt: str | int, colname: str, use_regex: bool = False
@@ -306,25 +981,36 @@ class CountryCode:
         Returns:
             pl.DataFrame: 匹配的记录
         """
-        res = pl.DataFrame()
+        return self._frame[self._find_rows(txt, colname, use_regex)]
+
+    def find_all(
+        self, code: int | str, source: str = "auto", use_regex: bool = False
+    ) -> pl.DataFrame:
+        """
+        查找与输入匹配的全部国家记录。
+
+        与 ``convert`` 只取第一个结果并输出警告不同，这里返回全部候选记录，
+        一次按行号取出，顺序与代码表一致。
+
+        Args:
+            code: 输入的国家代码
+            source: 源格式，默认为"auto"即自动识别
+            use_regex: 是否使用正则表达式匹配
+
+        Returns:
+            pl.DataFrame: 匹配的全部记录，未找到时为空表
+
+        Examples:
+            >>> cc = CountryCode()
+            >>> cc.find_all("China and Japan", use_regex=True)["ISO3"].to_list()
+            ['CHN', 'JPN']
+        """
         if use_regex:
-            clength = len(self._data.select(pl.col(colname)).collect())
-            for i in range(clength):
-                row = self._data.slice(i, 1).collect()
-                irex = (
-                    self._which_regex(colname)[i]
-                    if i < len(self._which_regex(colname))
-                    else None
-                )
-                if irex and irex.search(str(txt)):
-                    res = pl.concat([res, row])
-        else:
-            clength = len(self._data.select(pl.col(colname)).collect())
-            for i in range(clength):
-                row = self._data.slice(i, 1).collect()
-                if row[colname].item() == txt:
-                    res = pl.concat([res, row])
-        return res
+            return self._lazy_find(code, "regex", use_regex)
+        src = (
+            self._guess(code) if source == "auto" else self._get_valid_codename(source)
+        )
+        return self._lazy_find(code, src)
 
     def get_(self, ctype_: str, extra: list[str] | None = None) -> pl.DataFrame:
         """
@@ -387,47 +1073,55 @@ class CountryCode:
         else:
             code_list = list(code)
 
-        if target == "name":
-            tgt = "name_short"
-        elif target in reduce(lambda x, y: x + y, valid_trans.values()):
-            for k, v in valid_trans.items():
-                if target in v:
-                    tgt = k
-                    break
-        else:
-            tgt = target
+        tgt = self._get_valid_codename(target)
+        src = None if source == "auto" else self._get_valid_codename(source)
 
         results = []
         for single_code in code_list:
             if source == "auto":
-                src = self._guess_source(single_code)
-            elif source in reduce(lambda x, y: x + y, valid_trans.values()):
-                for k, v in valid_trans.items():
-                    if source in v:
-                        src = k
-                        break
-            else:
-                src = source
+                src = self._guess(single_code)
 
-            if use_regex:
-                res = self._lazy_find(single_code, "regex", use_regex)
-            else:
-                res = self._lazy_find(single_code, src, use_regex)
+            count, value = self._lookup(single_code, src, tgt, use_regex)
 
-            if len(res) == 0:
+            if count == 0:
                 results.append(not_found)
             else:
-                if len(res) > 1:
+                if count > 1:
                     print(
                         f"警告：输入 {single_code} 对应多个国家代码，仅返回第一个结果"
                     )
-                results.append(res[tgt].to_list()[0])
+                results.append(value)
 
         if is_single:
             return results[0]
         else:
             return results
 
+    def _lookup_uncached(
+        self, code: str | int, src: str, tgt: str, use_regex: bool
+    ) -> tuple[int, Any]:
+        """
+        查找单个国家代码，返回匹配数量和第一个匹配的目标值。
+
+        开启缓存时由 ``lru_cache`` 包装为 ``self._lookup``。
+
+        Args:
+            code: 输入的国家代码
+            src: 标准化后的源格式
+            tgt: 标准化后的目标格式
+            use_regex: 是否使用正则表达式匹配
+
+        Returns:
+            tuple[int, Any]: (匹配数量, 目标值)，未找到时目标值为 None
+        """
+        if use_regex:
+            rows = self._find_rows(code, "regex", use_regex)
+        else:
+            rows = self._find_rows(code, src, use_regex)
+        if not rows:
+            return 0, None
+        return len(rows), self._column(tgt)[rows[0]]
+
     def covert_series(
         self,
         series: Any,
@@ -440,6 +1134,10 @@ class CountryCode:
         """
         转换可迭代对象中的国家代码。
 
+        指定源格式且不使用正则匹配时，polars Series 以及长度不少于
+        ``BULK_MIN_SIZE`` 的输入整列交给 ``convert_frame`` 在 Polars 引擎中转换；
+        其余输入逐个转换不同的取值。
+
         Args:
             series: 输入的可迭代对象（字符串或整数）
             source: 源格式，默认为"auto"即自动识别
@@ -454,9 +1152,34 @@ class CountryCode:
         Raises:
             ValueError: 当 out_type 不支持时
         """
-        res_list = [
-            self.convert(i, source, target, not_found, use_regex) for i in series
-        ]
+        if not isinstance(series, pl.Series):
+            series = list(series)
+        if (
+            source != "auto"
+            and not use_regex
+            and (isinstance(series, pl.Series) or len(series) >= BULK_MIN_SIZE)
+        ):
+            codes = (
+                series
+                if isinstance(series, pl.Series)
+                else pl.Series(series, strict=False)
+            )
+            res_list = (
+                self.convert_frame(
+                    codes.to_frame("__code"),
+                    "__code",
+                    source=source,
+                    target=target,
+                    not_found=not_found,
+                    alias="__result",
+                )
+                .get_column("__result")
+                .to_list()
+            )
+        else:
+            res_list = self._convert_distinct(
+                list(series), source, target, not_found, use_regex
+            )
         if out_type == "series":
             return pl.Series(name=target, values=res_list)
         elif out_type == "dataframe":
@@ -466,6 +1189,390 @@ class CountryCode:
         else:
             raise ValueError(f"out_type {out_type} 不支持")
 
+    def _convert_distinct(
+        self,
+        codes: list[Any],
+        source: str,
+        target: str,
+        not_found: str | None,
+        use_regex: bool,
+    ) -> list[Any]:
+        """
+        逐个转换列表中的国家代码，每个不同的取值只查找一次。
+
+        Args:
+            codes: 输入的国家代码列表
+            source: 源格式
+            target: 目标格式
+            not_found: 未找到时的返回值
+            use_regex: 是否使用正则表达式匹配
+
+        Returns:
+            list[Any]: 与输入一一对应的转换结果
+        """
+        distinct = [c for c in dict.fromkeys(codes) if c is not None]
+        resolved = dict(
+            zip(distinct, self.convert(distinct, source, target, not_found, use_regex))
+        )
+        return [resolved.get(c, not_found) for c in codes]
+
+    def _first_rows(self, codes: list[Any]) -> list[int | None]:
+        """
+        用正则表达式匹配列表中的国家代码，返回第一个匹配的行号。
+
+        每个不同的取值只匹配一次，未匹配到时为 None。
+
+        Args:
+            codes: 输入的国家代码列表
+
+        Returns:
+            list[int | None]: 与输入一一对应的行号
+        """
+        resolved = {}
+        for code in dict.fromkeys(codes):
+            rows = [] if code is None else self._find_rows(code, "regex", True)
+            resolved[code] = rows[0] if rows else None
+        return [resolved[c] for c in codes]
+
+    def convert_many(
+        self,
+        code: int | str | Iterable[str | int],
+        targets: list[str],
+        source: str = "auto",
+        not_found: Any = None,
+        use_regex: bool = False,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """
+        将国家代码一次转换为多种格式。
+
+        每个输入只查找一次，所有目标格式从同一条记录中取值。
+
+        Args:
+            code: 输入的国家代码（字符串、整数或可迭代对象）
+            targets: 目标格式列表
+            source: 源格式，默认为"auto"即自动识别
+            not_found: 未找到时各目标格式的返回值
+            use_regex: 是否使用正则表达式匹配
+
+        Returns:
+            dict[str, Any] | list[dict[str, Any]]: {目标格式: 转换结果}，
+            输入为可迭代对象时返回与之一一对应的列表
+
+        Examples:
+            >>> cc = CountryCode()
+            >>> cc.convert_many("CHN", ["ISO2", "name_zh", "UNcode"])
+            {'ISO2': 'CN', 'name_zh': '中国', 'UNcode': 156}
+        """
+        is_single = isinstance(code, (str, int))
+        code_list = [code] if is_single else list(code)
+        tgts = {t: self._get_valid_codename(t) for t in targets}
+        src = None if source == "auto" else self._get_valid_codename(source)
+
+        results = []
+        for single_code in code_list:
+            if use_regex:
+                rows = self._find_rows(single_code, "regex", use_regex)
+            else:
+                rows = self._find_rows(
+                    single_code, src or self._guess(single_code), use_regex
+                )
+            if not rows:
+                results.append({t: not_found for t in tgts})
+                continue
+            if len(rows) > 1:
+                print(f"警告：输入 {single_code} 对应多个国家代码，仅返回第一个结果")
+            results.append({t: self._column(tgt)[rows[0]] for t, tgt in tgts.items()})
+
+        return results[0] if is_single else results
+
+    def convert_frame(
+        self,
+        data: pl.DataFrame | pl.LazyFrame,
+        column: str,
+        source: str = "ISO3",
+        target: str | list[str] = "name_zh",
+        not_found: Any = None,
+        use_regex: bool = False,
+        alias: str | list[str] | None = None,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """
+        按列转换数据帧中的国家代码。
+
+        精确匹配时与代码表做一次左连接，由 Polars 完成整列转换，
+        同样适用于 LazyFrame。自动识别时先向量化地识别每行的格式（规则同
+        ``_guess_source``），再按 (格式, 代码) 做一次连接，因此混合格式的列
+        也能整列转换；正则匹配时每个不同取值只匹配一次得到行号，再按行号连接。
+        目标格式为列表时，一次连接同时取出全部目标列。
+        一个输入对应多个国家时取第一个结果。
+
+        Args:
+            data: 输入的 DataFrame 或 LazyFrame
+            column: 待转换的列名
+            source: 源格式，默认为"ISO3"，可选自动方式'auto'
+            target: 目标格式或目标格式列表，默认为"name_zh"
+            not_found: 未找到时的填充值
+            use_regex: 是否使用正则表达式匹配
+            alias: 结果列名（目标为列表时为等长列表），默认与目标格式同名（已存在时覆盖）
+
+        Returns:
+            pl.DataFrame | pl.LazyFrame: 追加了转换结果列的数据，类型与输入一致
+
+        Raises:
+            ValueError: 当 alias 与 target 的数量不一致时
+
+        Examples:
+            >>> cc = CountryCode()
+            >>> df = pl.DataFrame({"iso3": ["CHN", "USA"]})
+            >>> cc.convert_frame(df, "iso3", target="ISO2")["ISO2"].to_list()
+            ['CN', 'US']
+            >>> cc.convert_frame(df, "iso3", target=["ISO2", "name_zh"]).columns
+            ['iso3', 'ISO2', 'name_zh']
+        """
+        targets = [target] if isinstance(target, str) else list(target)
+        tgts = [self._get_valid_codename(t) for t in targets]
+        if alias is None:
+            outs = tgts
+        else:
+            outs = [alias] if isinstance(alias, str) else list(alias)
+            if len(outs) != len(tgts):
+                raise ValueError("alias 的数量必须与 target 一致")
+        values = [pl.col(tgt).alias(f"__value{i}") for i, tgt in enumerate(tgts)]
+        dtype = data.collect_schema()[column]
+
+        if use_regex:
+            on = ["__key"]
+            keys = [
+                pl.col(column)
+                .map_batches(
+                    lambda s: pl.Series(
+                        self._first_rows(s.to_list()), dtype=pl.get_index_type()
+                    ),
+                    return_dtype=pl.get_index_type(),
+                    is_elementwise=True,
+                )
+                .alias("__key")
+            ]
+            lookup = self._data.with_row_index("__key").select("__key", *values)
+        elif source == "auto":
+            # 逐行识别格式后，以 (格式, 代码) 为键与各格式的代码表做一次连接
+            on = ["__source", "__key"]
+            guess = _guess_expr(pl.col(column), dtype)
+            keys = [
+                guess.alias("__source"),
+                pl.when(guess == "ISOnumeric")
+                .then(_integer_key(pl.col(column), dtype).cast(pl.String))
+                .otherwise(pl.col(column).cast(pl.String))
+                .alias("__key"),
+            ]
+            lookup = pl.concat(
+                [
+                    self._data.select(
+                        pl.lit(fmt).alias("__source"),
+                        pl.col(fmt).cast(pl.String).alias("__key"),
+                        *values,
+                    )
+                    for fmt in AUTO_SOURCES
+                ]
+            )
+        else:
+            on = ["__key"]
+            src = self._get_valid_codename(source)
+            key = pl.col(column)
+            if self._schema[src].is_integer():
+                # 与逐个转换的 _normalize_key 一致：字符串先去掉首尾空白再转换
+                key = _integer_key(key, dtype)
+            keys = [key.cast(self._schema[src], strict=False).alias("__key")]
+            lookup = self._data.select(pl.col(src).alias("__key"), *values)
+
+        lookup = lookup.drop_nulls("__key").unique(
+            on, keep="first", maintain_order=True
+        )
+        frame = data.lazy() if isinstance(data, pl.DataFrame) else data
+        res = (
+            frame.with_columns(keys)
+            .join(lookup, on=on, how="left", maintain_order="left")
+            .with_columns(
+                pl.col(f"__value{i}").alias(out) for i, out in enumerate(outs)
+            )
+            .drop(*on, *[f"__value{i}" for i in range(len(outs))])
+        )
+        if not_found is not None:
+            res = res.with_columns(pl.col(outs).fill_null(not_found))
+        if isinstance(data, pl.DataFrame):
+            res = res.collect()
+        return res
+
+    def _fuzzy_rows(
+        self, texts: list[Any], min_score: float
+    ) -> list[tuple[int | None, float]]:
+        """
+        模糊匹配列表中的名称，每个不同的取值只匹配一次。
+
+        Args:
+            texts: 输入的名称列表
+            min_score: 最低得分，低于该得分的结果行号为 None
+
+        Returns:
+            list[tuple[int | None, float]]: 与输入一一对应的 (行号, 得分)
+        """
+        resolved = {}
+        for txt in dict.fromkeys(texts):
+            if txt is None:
+                resolved[txt] = (None, 0.0)
+                continue
+            row, score = self._fuzzy.best(str(txt))
+            resolved[txt] = (row if score >= min_score else None, score)
+        return [resolved[t] for t in texts]
+
+    def fuzzy_match(
+        self,
+        text: str | Iterable[str],
+        target: str = "ISO3",
+        min_score: float = 0.5,
+        not_found: Any = None,
+    ) -> tuple[Any, float] | list[tuple[Any, float]]:
+        """
+        按名称模糊匹配国家，容忍拼写错误。
+
+        在 ``FUZZY_COLUMNS``（name_short、name_zh、name_official）上建立字符
+        bigram 倒排索引（首次使用时建立），按 Dice 系数打分，每次查询只比较
+        与输入共享 bigram 的名称。适合作为精确匹配和正则匹配失败后的兜底。
+
+        Args:
+            text: 输入的国家名称（字符串或可迭代对象）
+            target: 目标格式，默认为"ISO3"
+            min_score: 最低得分（0 到 1），默认 0.5，低于该得分视为未找到
+            not_found: 未找到时的返回值
+
+        Returns:
+            tuple[Any, float] | list[tuple[Any, float]]: (转换结果, 得分)，
+            未找到时返回 (not_found, 最佳得分)；输入为可迭代对象时返回列表
+
+        Examples:
+            >>> cc = CountryCode()
+            >>> cc.fuzzy_match("Untied States of America")[0]
+            'USA'
+            >>> cc.fuzzy_match(["Chinna", "zzzz"], not_found="未知")
+            [('CHN', 0.923...), ('未知', 0.2)]
+        """
+        tgt = self._get_valid_codename(target)
+        is_single = isinstance(text, str)
+        texts = [text] if is_single else list(text)
+        values = self._column(tgt)
+        results = [
+            (not_found if row is None else values[row], score)
+            for row, score in self._fuzzy_rows(texts, min_score)
+        ]
+        return results[0] if is_single else results
+
+    def fuzzy_match_frame(
+        self,
+        data: pl.DataFrame | pl.LazyFrame,
+        column: str,
+        target: str = "ISO3",
+        min_score: float = 0.5,
+        not_found: Any = None,
+        alias: str | None = None,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """
+        按列模糊匹配数据帧中的国家名称。
+
+        每个不同的取值只匹配一次，结果追加为目标列和对应的得分列
+        （``{列名}_score``）。
+
+        Args:
+            data: 输入的 DataFrame 或 LazyFrame
+            column: 国家名称所在的列名
+            target: 目标格式，默认为"ISO3"
+            min_score: 最低得分，默认 0.5
+            not_found: 未找到时的填充值
+            alias: 结果列名，默认与目标格式同名
+
+        Returns:
+            pl.DataFrame | pl.LazyFrame: 追加了结果列和得分列的数据，类型与输入一致
+
+        Examples:
+            >>> cc = CountryCode()
+            >>> df = pl.DataFrame({"name": ["Chinna", "Japn"]})
+            >>> cc.fuzzy_match_frame(df, "name")["ISO3"].to_list()
+            ['CHN', 'JPN']
+        """
+        tgt = self._get_valid_codename(target)
+        out = alias or tgt
+        values = self._column(tgt)
+        dtype = pl.Struct({"__value": self._schema[tgt], "__score": pl.Float64})
+
+        def match(batch: pl.Series) -> pl.Series:
+            rows = self._fuzzy_rows(batch.to_list(), min_score)
+            return pl.Series(
+                [
+                    {"__value": None if row is None else values[row], "__score": score}
+                    for row, score in rows
+                ],
+                dtype=dtype,
+            )
+
+        fuzzy = pl.col("__fuzzy").struct
+        res = (
+            data.with_columns(
+                pl.col(column)
+                .map_batches(match, return_dtype=dtype, is_elementwise=True)
+                .alias("__fuzzy")
+            )
+            .with_columns(
+                fuzzy.field("__value").alias(out),
+                fuzzy.field("__score").alias(f"{out}_score"),
+            )
+            .drop("__fuzzy")
+        )
+        if not_found is not None:
+            res = res.with_columns(pl.col(out).fill_null(not_found))
+        return res
+
+    def enrich(
+        self,
+        lf: pl.LazyFrame | pl.DataFrame,
+        column: str,
+        targets: str | list[str],
+        source: str = "ISO3",
+        not_found: Any = None,
+        use_regex: bool = False,
+        alias: str | list[str] | None = None,
+    ) -> pl.LazyFrame:
+        """
+        为 LazyFrame 追加国家代码信息列。
+
+        与代码表构建惰性左连接，不会物化输入数据，结果可直接用于
+        ``collect(engine="streaming")`` 或 ``sink_parquet`` 等流式输出，
+        以有限内存处理超出内存的数据集。正则匹配按批处理，同样支持流式执行。
+
+        Args:
+            lf: 输入的 LazyFrame（DataFrame 会转为 LazyFrame）
+            column: 国家代码所在的列名
+            targets: 目标格式或目标格式列表
+            source: 源格式，默认为"ISO3"，可选自动方式'auto'
+            not_found: 未找到时的填充值
+            use_regex: 是否使用正则表达式匹配
+            alias: 结果列名，默认与目标格式同名
+
+        Returns:
+            pl.LazyFrame: 追加了目标列的 LazyFrame
+
+        Examples:
+            >>> cc = CountryCode()
+            >>> lf = pl.scan_parquet("trade.parquet")
+            >>> cc.enrich(lf, "iso3", ["ISO2", "name_zh"]).sink_parquet("out.parquet")
+        """
+        return self.convert_frame(
+            lf.lazy(),
+            column,
+            source=source,
+            target=targets,
+            not_found=not_found,
+            use_regex=use_regex,
+            alias=alias,
+        )
+
 
 def country_convert(
     txt: str | Iterable[str | int],
@@ -504,7 +1611,7 @@ def country_convert(
         >>> country_convert("中国", src="name_zh", to="ISO2")
         'CN'
     """
-    converter = CountryCode(additional_data)
+    converter = CountryCode.shared(additional_data)
     if is_data_container(txt):
         if hasattr(txt, "shape") and hasattr(txt, "columns"):
             return converter.covert_series(
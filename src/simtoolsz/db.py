@@ -5,8 +5,10 @@
 
 主要功能:
     - zip2db: 将zip压缩包中的数据导入DuckDB
+    - zip2parquet: 将zip压缩包中的数据转换为Parquet文件
     - special2db: 将特殊格式文件（tsv、avro、arrow）导入DuckDB
     - multizip2db: 将多个压缩包中的数据合并导入DuckDB
+    - bulk_load: 批量导入的上下文，控制检查点、插入顺序与内存上限
 
 支持的数据格式:
     - CSV: 逗号分隔值文件
@@ -18,21 +20,1229 @@
     - Arrow: Apache Arrow格式
 """
 
-from typing import Optional, Dict, List, Union
+from typing import Any, Callable, Iterator, Optional, Dict, List, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from datetime import datetime, timedelta
+from fnmatch import fnmatchcase
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo
+import hashlib
+import json
+import math
+import re
+import shutil
+import threading
+import xml.etree.ElementTree as ET
 
 import duckdb
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.json as pajson
+import pyarrow.parquet as pq
 
-__all__ = ["zip2db", "special2db", "multizip2db"]
+__all__ = ["zip2db", "zip2parquet", "special2db", "multizip2db", "bulk_load"]
+
+# 增量导入时记录已导入压缩包成员的清单表
+MANIFEST_TABLE = "_ingest_manifest"
+
+# 批量导入时记录数据来源的列，使用保留的列名以免与数据中的列重名
+SOURCE_COLUMN = "_source_file"
+
+# 缓存CSV/JSON探测结果（格式与列类型）的表
+SCHEMA_CACHE_TABLE = "_schema_cache"
+
+# 各数据格式对应的DuckDB读取函数
+_SCAN_FUNCTIONS = {
+    ".csv": "read_csv_auto",
+    ".tsv": "read_csv_auto",
+    ".parquet": "read_parquet",
+    ".json": "read_json_auto",
+}
+
+# 支持导入的全部数据格式，XLSX 由 _xlsx_reader 流式解析
+_DATA_SUFFIXES = [*_SCAN_FUNCTIONS, ".xlsx"]
+
+# 只用于 XLSX 的读取参数，不会传给其他格式的读取函数
+_XLSX_ONLY_OPTIONS = {"sheet", "layer", "chunk_size"}
+
+# _execute_with_schema 读取 XLSX 时注册的视图名
+_XLSX_VIEW = "__xlsx_stream"
+
+# XLSX 的命名空间
+_XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_XLSX_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+# XLSX 内置的日期时间数字格式编号
+_XLSX_DATE_FORMATS = {*range(14, 23), *range(27, 37), *range(45, 48), *range(50, 59)}
+
+# 调用方给出这些参数时已无需探测，不使用 schema 缓存
+_SCHEMA_CACHE_BYPASS = {"columns", "types", "dtypes", "column_types", "auto_detect"}
+
+# zip2db 支持的数据格式，未指定文件名时按此顺序导入
+_ZIP2DB_SUFFIXES = [".csv", ".xlsx", ".parquet", ".json"]
+
+
+# 流式读取时，DuckDB CSV 参数到 pyarrow 选项的映射：{参数名: (选项类别, 选项名)}
+_ARROW_CSV_OPTIONS = {
+    "delim": ("parse", "delimiter"),
+    "sep": ("parse", "delimiter"),
+    "delimiter": ("parse", "delimiter"),
+    "quote": ("parse", "quote_char"),
+    "escape": ("parse", "escape_char"),
+    "skip": ("read", "skip_rows"),
+    "encoding": ("read", "encoding"),
+    "names": ("read", "column_names"),
+    "column_names": ("read", "column_names"),
+    "nullstr": ("convert", "null_values"),
+}
+
+
+def _sql_literal(value: Any) -> str:
+    """
+    将 Python 值转换为 DuckDB SQL 字面量，保留其类型。
+
+    - None → ``NULL``
+    - bool → ``true`` / ``false``
+    - int、float → 数值，NaN 与无穷大为 ``'nan'::DOUBLE``、``'inf'::DOUBLE``
+    - str、Path → 单引号字符串（转义其中的单引号）
+    - list、tuple → 列表 ``[...]``
+    - dict → 结构体 ``{'键': 值, ...}``，如 ``columns``、``types`` 参数
+
+    Args:
+        value: 要转换的值
+
+    Returns:
+        str: SQL 字面量
+
+    Raises:
+        ValueError: 当值的类型无法转换时
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and not math.isfinite(value):
+        return f"'{value}'::DOUBLE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (str, Path)):
+        return "'{}'".format(str(value).replace("'", "''"))
+    if isinstance(value, (list, tuple)):
+        return "[{}]".format(", ".join(_sql_literal(v) for v in value))
+    if isinstance(value, dict):
+        return "{{{}}}".format(
+            ", ".join(
+                f"{_sql_literal(str(k))}: {_sql_literal(v)}" for k, v in value.items()
+            )
+        )
+    raise ValueError(f"无法转换为SQL字面量的参数值: {value!r}")
+
+
+def _reader_options(kwargs: Dict[str, Any]) -> List[str]:
+    """
+    将读取参数转换为 DuckDB 读取函数的命名参数列表（``名称=字面量``）。
+
+    参数值按类型转换为字面量（见 ``_sql_literal``），因此可以传入
+    ``header=True``、``sample_size=-1``、``columns={'id': 'BIGINT'}`` 等，
+    显式给出列和类型以跳过大文件的自动探测。
+
+    Args:
+        kwargs: 读取参数
+
+    Returns:
+        List[str]: 命名参数列表
+
+    Raises:
+        ValueError: 当参数名不是合法标识符或参数值无法转换时
+    """
+    options = []
+    for key, value in kwargs.items():
+        if not key.isidentifier():
+            raise ValueError(f"无效的参数名: {key!r}")
+        options.append(f"{key}={_sql_literal(value)}")
+    return options
+
+
+def _format_options(suffix: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    从调用方给出的读取参数中选出某种格式使用的参数。
+
+    压缩包中常同时含有多种格式：XLSX 只使用 ``sheet``、``layer``、``chunk_size``
+    与 ``header``；其余格式去掉这些 XLSX 专用的参数，其余参数原样保留。
+
+    Args:
+        suffix: 数据文件的扩展名（小写）
+        kwargs: 读取参数
+
+    Returns:
+        Dict[str, Any]: 该格式使用的读取参数
+    """
+    if suffix == ".xlsx":
+        return {
+            k: v for k, v in kwargs.items() if k in _XLSX_ONLY_OPTIONS or k == "header"
+        }
+    return {k: v for k, v in kwargs.items() if k not in _XLSX_ONLY_OPTIONS}
+
+
+def _scan_sql(suffix: str, source: Any, options: Dict[str, Any]) -> str:
+    """
+    返回读取数据文件的表函数调用，如 ``read_csv_auto('a.csv', header=true)``。
+
+    XLSX 返回 ``_execute_with_schema`` 注册的视图名，读取参数由 ``_xlsx_reader`` 处理。
+
+    Args:
+        suffix: 数据文件的扩展名（小写）
+        source: 数据文件路径或路径列表
+        options: 读取参数
+
+    Returns:
+        str: 表函数调用
+    """
+    if suffix == ".xlsx":
+        return _XLSX_VIEW
+    if suffix == ".tsv":
+        options = {"delim": "\t", **options}
+    args = [_sql_literal(source), *_reader_options(options)]
+    return f"{_SCAN_FUNCTIONS[suffix]}({', '.join(args)})"
+
+
+def _table_name(
+    table: Optional[Union[Dict[str, str], List[str], str]],
+    name: str,
+    stem: str,
+    i: int,
+    total: int,
+) -> str:
+    """
+    按 zip2db 的 table 参数确定数据文件对应的表名，并去除非法字符。
+
+    Args:
+        table: zip2db 的 table 参数
+        name: 文件名
+        stem: 文件名（不含扩展名）
+        i: 文件序号
+        total: 文件总数
+
+    Returns:
+        str: 表名
+    """
+    if isinstance(table, dict):
+        table_name = table.get(name) or stem
+    elif isinstance(table, list):
+        table_name = table[i] if i < len(table) else stem
+    elif isinstance(table, str) and total == 1:
+        table_name = table
+    else:
+        table_name = stem
+    return "".join(c for c in table_name if c.isalnum() or c == "_")
+
+
+def _connect(
+    db: Union[str, Path, duckdb.DuckDBPyConnection],
+) -> Tuple[duckdb.DuckDBPyConnection, bool]:
+    """
+    连接到数据库；传入的已是DuckDB连接时直接使用。
+
+    Args:
+        db: 数据库文件路径或DuckDB连接
+
+    Returns:
+        Tuple[duckdb.DuckDBPyConnection, bool]: (连接, 是否为新建的连接)
+    """
+    if isinstance(db, duckdb.DuckDBPyConnection):
+        return db, False
+    return duckdb.connect(db if db == ":memory:" else Path(db)), True
+
+
+@contextmanager
+def _transaction(con: duckdb.DuckDBPyConnection) -> Iterator[None]:
+    """
+    在一个事务中执行，出错时回滚并抛出异常。连接上已有未提交的事务时沿用该事务。
+    """
+    try:
+        con.begin()
+    except duckdb.TransactionException:
+        yield
+        return
+    try:
+        yield
+    except BaseException:
+        con.rollback()
+        raise
+    con.commit()
+
+
+def _in_transaction(con: duckdb.DuckDBPyConnection, load: Callable[[bool], Any]) -> Any:
+    """
+    在一个事务中执行一批导入，避免逐条自动提交反复写入 WAL。
+
+    ``load`` 接收 ``strict`` 参数，为 True 时单个文件出错直接抛出异常。
+    DuckDB 的事务中任一语句出错后整个事务只能回滚（不支持保存点），
+    此时改为 ``strict=False`` 逐条自动提交重新执行，跳过出错的文件、保留其余文件。
+
+    Args:
+        con: DuckDB数据库连接
+        load: 执行导入的函数
+
+    Returns:
+        Any: ``load`` 的返回值
+    """
+    try:
+        with _transaction(con):
+            return load(True)
+    except Exception:
+        return load(False)
+
+
+@contextmanager
+def bulk_load(
+    con: duckdb.DuckDBPyConnection,
+    checkpoint_threshold: Optional[str] = "1GB",
+    preserve_insertion_order: Optional[bool] = False,
+    memory_limit: Optional[str] = None,
+) -> Iterator[duckdb.DuckDBPyConnection]:
+    """
+    批量导入的上下文：调整DuckDB的写入设置，退出时恢复原设置并只执行一次检查点。
+
+    DuckDB 在 WAL 超过 ``checkpoint_threshold``（默认 16MB）时自动执行检查点，
+    大量导入时会反复将数据写回数据库文件。在上下文中调大该阈值，导入结束后
+    统一执行一次 ``CHECKPOINT``。导入函数可直接接收该连接，每个压缩包在一个
+    事务中导入。导入函数自行打开数据库时也会在此上下文中导入（不改变插入顺序）。
+
+    Args:
+        con: DuckDB数据库连接
+        checkpoint_threshold: 自动检查点的 WAL 大小阈值，默认 "1GB"
+        preserve_insertion_order: 是否保持插入顺序，默认 False。关闭后DuckDB
+                                  可以并行写入并降低内存占用，但行的顺序不再与文件一致
+        memory_limit: 内存上限，如 "4GB"，默认不修改
+
+    参数为 None 时不修改对应的设置。原本处于默认值的设置退出时以 ``RESET``
+    恢复（如按内存比例计算的 ``memory_limit``）；已被修改的设置只能按
+    ``current_setting`` 显示的值（可能经过取整）恢复。
+
+    Yields:
+        duckdb.DuckDBPyConnection: 传入的连接
+
+    Examples:
+        >>> con = duckdb.connect('all_data.db')
+        >>> with bulk_load(con, memory_limit='4GB'):
+        ...     for zip_file in zips:
+        ...         zip2db(zip_file, con)
+    """
+    settings = {
+        "checkpoint_threshold": checkpoint_threshold,
+        "preserve_insertion_order": preserve_insertion_order,
+        "memory_limit": memory_limit,
+    }
+    query = "SELECT value FROM duckdb_settings() WHERE name = ?"
+    previous = {}
+    defaults = None
+    for name, value in settings.items():
+        if value is None:
+            continue
+        if defaults is None:
+            with duckdb.connect() as fresh:
+                defaults = {
+                    n: fresh.execute(query, [n]).fetchone()[0] for n in settings
+                }
+        if con.execute(query, [name]).fetchone()[0] == defaults[name]:
+            # 显示值经过取整（如 "4.6 GiB"），默认值用 RESET 恢复而不是写回该字符串
+            previous[name] = None
+        else:
+            previous[name] = con.execute(
+                "SELECT current_setting(?)", [name]
+            ).fetchone()[0]
+        con.execute(f"SET {name} = {_sql_literal(value)}")
+    try:
+        yield con
+        con.execute("CHECKPOINT")
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                con.execute(f"RESET {name}")
+            else:
+                con.execute(f"SET {name} = {_sql_literal(value)}")
+
+
+def _run_loads(
+    con: duckdb.DuckDBPyConnection,
+    loads: List[Tuple[str, str, Callable[[duckdb.DuckDBPyConnection], Any]]],
+    workers: int = 1,
+) -> List[bool]:
+    """
+    执行一组建表任务，可选地用线程池并发执行。
+
+    每个任务先删除同名表，再调用建表函数。依次执行时全部任务在一个事务中完成
+    （见 ``_in_transaction``）；并发执行时每个工作线程使用
+    ``con.cursor()`` 创建的独立游标，DuckDB 在读取和解析文件时释放 GIL，
+    多个文件可同时解析。写入同一张表的任务（如 ``a.csv`` 与 ``a.json``）
+    归为一组，在同一线程中按原顺序执行，结果与依次执行一致。
+    单个文件出错时输出提示并继续处理其余文件。
+
+    Args:
+        con: DuckDB数据库连接
+        loads: 任务列表，每项为 (文件名, 表名, 建表函数)，建表函数接收游标
+        workers: 并发线程数，默认为 1 即依次执行
+
+    Returns:
+        List[bool]: 与任务一一对应的是否成功
+    """
+
+    def run(cursor, name, table_name, create, strict=False):
+        try:
+            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+            create(cursor)
+            return True
+        except Exception as e:
+            if strict:
+                raise
+            print(f"处理文件 {name} 时出错: {e}")
+            return False
+
+    # DuckDB 的表名不区分大小写
+    groups: Dict[str, List[int]] = {}
+    for i, (_, table_name, _) in enumerate(loads):
+        groups.setdefault(table_name.lower(), []).append(i)
+
+    if workers <= 1 or len(groups) <= 1:
+        return _in_transaction(
+            con, lambda strict: [run(con, *load, strict) for load in loads]
+        )
+
+    local = threading.local()
+    cursors = []
+    done = [False] * len(loads)
+
+    def task(indices):
+        cursor = getattr(local, "cursor", None)
+        if cursor is None:
+            cursor = local.cursor = con.cursor()
+            cursors.append(cursor)
+        for i in indices:
+            done[i] = run(cursor, *loads[i])
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(task, groups.values()))
+    finally:
+        for cursor in cursors:
+            cursor.close()
+    return done
+
+
+def _arrow_csv_reader(source: Any, **kwargs) -> pa.RecordBatchReader:
+    """
+    以 pyarrow 流式解析 CSV，返回逐块读取的 RecordBatchReader。
+
+    支持常用的 DuckDB CSV 参数（delim、quote、escape、skip、encoding、names、
+    nullstr、header），其余参数会被忽略并输出提示。
+
+    Args:
+        source: 文件路径或文件对象
+        **kwargs: DuckDB 风格的 CSV 读取参数
+
+    Returns:
+        pa.RecordBatchReader: 按块读取的数据
+    """
+    options = {"read": {}, "parse": {}, "convert": {}}
+    for key, value in kwargs.items():
+        if key == "header":
+            if str(value).lower() in ("false", "0"):
+                options["read"]["autogenerate_column_names"] = True
+        elif key in _ARROW_CSV_OPTIONS:
+            kind, name = _ARROW_CSV_OPTIONS[key]
+            if name == "null_values" and isinstance(value, str):
+                value = [value]
+            options[kind][name] = value
+        else:
+            print(f"流式读取不支持参数 {key}，已忽略")
+    return pacsv.open_csv(
+        source,
+        read_options=pacsv.ReadOptions(**options["read"]),
+        parse_options=pacsv.ParseOptions(**options["parse"]),
+        convert_options=pacsv.ConvertOptions(**options["convert"]),
+    )
+
+
+def _arrow_member_reader(f: Any, suffix: str, **kwargs) -> pa.RecordBatchReader:
+    """
+    从压缩包成员的文件对象读取数据，返回 RecordBatchReader，不解压到磁盘。
+
+    CSV/TSV 与按行分隔的 JSON 逐块流式解析；JSON 数组整体读入内存；
+    Parquet 按行组读取。
+
+    Args:
+        f: ``ZipFile.open`` 返回的文件对象
+        suffix: 成员的扩展名（小写）
+        **kwargs: 传递给读取器的额外参数
+
+    Returns:
+        pa.RecordBatchReader: 按块读取的数据
+
+    Raises:
+        ValueError: 当成员格式不支持流式读取时
+    """
+    kwargs = _format_options(suffix, kwargs)
+    if suffix == ".csv":
+        return _arrow_csv_reader(f, **kwargs)
+    elif suffix == ".tsv":
+        return _arrow_csv_reader(f, **{"delim": "\t", **kwargs})
+    elif suffix == ".json":
+        if f.peek(64).lstrip()[:1] == b"[":
+            return pl.read_json(f).to_arrow().to_reader()
+        return pajson.open_json(f)
+    elif suffix == ".parquet":
+        parquet = pq.ParquetFile(f)
+        return pa.RecordBatchReader.from_batches(
+            parquet.schema_arrow, parquet.iter_batches()
+        )
+    raise ValueError(f"不支持流式读取的文件格式: {suffix}")
+
+
+def _xlsx_text(element: ET.Element) -> str:
+    """拼接共享字符串或内联字符串中的文本，忽略注音（``rPh``）。"""
+    parts = []
+    for child in element:
+        if child.tag == f"{_XLSX_NS}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{_XLSX_NS}r":
+            parts.append(child.findtext(f"{_XLSX_NS}t") or "")
+    return "".join(parts)
+
+
+def _xlsx_column(ref: str) -> int:
+    """将单元格引用（如 ``AB12``）转换为从 0 开始的列序号。"""
+    index = 0
+    for char in ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + ord(char.upper()) - 64
+    return index - 1
+
+
+def _xlsx_is_date_format(code: str) -> bool:
+    """判断自定义数字格式是否为日期或时间格式。"""
+    code = re.sub(r'"[^"]*"|\[[^\]]*\]|\\.|_.|\*.', "", code)
+    return re.search(r"[dmyhs]", code, re.IGNORECASE) is not None
+
+
+def _xlsx_workbook(
+    xlsx: ZipFile, sheet: Optional[Union[str, int]] = None
+) -> Tuple[str, List[str], List[bool], datetime]:
+    """
+    读取工作簿的元数据。
+
+    Args:
+        xlsx: 以 ZipFile 打开的工作簿
+        sheet: 工作表名或从 0 开始的序号，默认为第一个工作表
+
+    Returns:
+        Tuple[str, List[str], List[bool], datetime]:
+            (工作表的 XML 成员名, 共享字符串, 各单元格样式是否为日期, 日期序列号的起点)
+
+    Raises:
+        ValueError: 当工作表不存在时
+    """
+    workbook = ET.fromstring(xlsx.read("xl/workbook.xml"))
+    sheets = {
+        s.get("name"): s.get(f"{_XLSX_REL_NS}id")
+        for s in workbook.iter(f"{_XLSX_NS}sheet")
+    }
+    if sheet is None:
+        sheet = 0
+    if isinstance(sheet, int):
+        if not 0 <= sheet < len(sheets):
+            raise ValueError(f"工作表不存在: {sheet}")
+        sheet = list(sheets)[sheet]
+    if sheet not in sheets:
+        raise ValueError(f"工作表不存在: {sheet}")
+
+    rels = ET.fromstring(xlsx.read("xl/_rels/workbook.xml.rels"))
+    target = next(r.get("Target") for r in rels if r.get("Id") == sheets[sheet])
+    path = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+
+    properties = workbook.find(f"{_XLSX_NS}workbookPr")
+    if properties is not None and properties.get("date1904") in ("1", "true"):
+        epoch = datetime(1904, 1, 1)
+    else:
+        epoch = datetime(1899, 12, 30)
+
+    names = set(xlsx.namelist())
+    strings = []
+    if "xl/sharedStrings.xml" in names:
+        with xlsx.open("xl/sharedStrings.xml") as f:
+            for _, element in ET.iterparse(f):
+                if element.tag == f"{_XLSX_NS}si":
+                    strings.append(_xlsx_text(element))
+                    element.clear()
+
+    date_styles = []
+    if "xl/styles.xml" in names:
+        styles = ET.fromstring(xlsx.read("xl/styles.xml"))
+        custom = {
+            int(f.get("numFmtId")): f.get("formatCode", "")
+            for f in styles.iter(f"{_XLSX_NS}numFmt")
+        }
+        cell_xfs = styles.find(f"{_XLSX_NS}cellXfs")
+        for xf in cell_xfs if cell_xfs is not None else []:
+            fmt = int(xf.get("numFmtId", 0))
+            if fmt in custom:
+                date_styles.append(_xlsx_is_date_format(custom[fmt]))
+            else:
+                date_styles.append(fmt in _XLSX_DATE_FORMATS)
+
+    return path, strings, date_styles, epoch
+
+
+def _xlsx_rows(
+    xlsx: ZipFile,
+    path: str,
+    strings: List[str],
+    date_styles: List[bool],
+    epoch: datetime,
+) -> Iterator[List[Tuple[int, str, Any]]]:
+    """
+    以 ``iterparse`` 逐行解析工作表 XML，解析完的行立即释放。
+
+    Yields:
+        List[Tuple[int, str, Any]]: 一行中非空的单元格 (列序号, 类型, 值)，
+            类型为 int、float、bool、date、str 之一
+    """
+    with xlsx.open(path) as f:
+        sheet_data = None
+        for event, element in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if element.tag == f"{_XLSX_NS}sheetData":
+                    sheet_data = element
+                continue
+            if element.tag != f"{_XLSX_NS}row":
+                continue
+
+            cells = []
+            for c in element.iter(f"{_XLSX_NS}c"):
+                ref = c.get("r")
+                col = _xlsx_column(ref) if ref else (cells[-1][0] + 1 if cells else 0)
+                kind = c.get("t", "n")
+                if kind == "inlineStr":
+                    node = c.find(f"{_XLSX_NS}is")
+                    if node is not None:
+                        cells.append((col, "str", _xlsx_text(node)))
+                    continue
+                raw = c.findtext(f"{_XLSX_NS}v")
+                if raw is None or kind == "e":
+                    continue
+                if kind == "s":
+                    cells.append((col, "str", strings[int(raw)]))
+                elif kind == "str":
+                    cells.append((col, "str", raw))
+                elif kind == "b":
+                    cells.append((col, "bool", raw == "1"))
+                elif kind == "d":
+                    cells.append((col, "date", datetime.fromisoformat(raw)))
+                else:
+                    style = int(c.get("s", 0))
+                    if style < len(date_styles) and date_styles[style]:
+                        offset = timedelta(milliseconds=round(float(raw) * 86_400_000))
+                        cells.append((col, "date", epoch + offset))
+                    elif raw.lstrip("-").isdigit() and -(2**63) <= int(raw) < 2**63:
+                        cells.append((col, "int", int(raw)))
+                    else:
+                        cells.append((col, "float", float(raw)))
+
+            # 释放已解析的行，避免整张工作表累积在内存中
+            (sheet_data if sheet_data is not None else element).clear()
+            if cells:
+                yield cells
+
+
+def _xlsx_reader(
+    source: Union[str, Path],
+    sheet: Optional[Union[str, int]] = None,
+    header: bool = True,
+    chunk_size: int = 65_536,
+    **kwargs,
+) -> pa.RecordBatchReader:
+    """
+    流式解析 XLSX 工作表，按块返回 RecordBatchReader，不依赖 spatial 扩展。
+
+    第一遍逐行扫描推断各列类型，第二遍每 ``chunk_size`` 行生成一个记录批次，
+    内存占用只与共享字符串表和单个批次的大小有关。整列为整数时为 BIGINT，
+    含小数时为 DOUBLE，日期格式的数字为 TIMESTAMP，布尔值为 BOOLEAN，
+    其余（含混合类型的列）为 VARCHAR。
+
+    Args:
+        source: XLSX 文件路径
+        sheet: 工作表名或从 0 开始的序号，默认为第一个工作表
+        header: 第一行是否为列名，默认 True；否则列名为 column0、column1……
+        chunk_size: 每个记录批次的行数
+        **kwargs: 兼容 ``st_read`` 的 ``layer``（工作表名），其余参数会被忽略并输出提示
+
+    Returns:
+        pa.RecordBatchReader: 按块读取的数据
+
+    Raises:
+        ValueError: 当工作表不存在时
+    """
+    if "layer" in kwargs:
+        sheet = kwargs.pop("layer")
+    for key in kwargs:
+        print(f"XLSX 读取不支持参数 {key}，已忽略")
+
+    xlsx = ZipFile(source, "r")
+    try:
+        path, strings, date_styles, epoch = _xlsx_workbook(xlsx, sheet)
+
+        header_row, kinds = {}, {}
+        rows = _xlsx_rows(xlsx, path, strings, date_styles, epoch)
+        if header:
+            header_row = {col: value for col, _, value in next(rows, [])}
+        for cells in rows:
+            for col, kind, _ in cells:
+                kinds.setdefault(col, set()).add(kind)
+    except Exception:
+        xlsx.close()
+        raise
+
+    width = max([*header_row, *kinds], default=-1) + 1
+    names, seen = [], set()
+    for col in range(width):
+        name = str(header_row.get(col, "")) or f"column{col}"
+        while name in seen:
+            name = f"{name}_{col}"
+        seen.add(name)
+        names.append(name)
+
+    types = []
+    for col in range(width):
+        column_kinds = kinds.get(col, set())
+        if column_kinds == {"int"}:
+            types.append(pa.int64())
+        elif column_kinds and column_kinds <= {"int", "float"}:
+            types.append(pa.float64())
+        elif column_kinds == {"bool"}:
+            types.append(pa.bool_())
+        elif column_kinds == {"date"}:
+            types.append(pa.timestamp("us"))
+        else:
+            types.append(pa.string())
+    schema = pa.schema(list(zip(names, types)))
+
+    def to_text(kind, value):
+        if kind == "bool":
+            return "TRUE" if value else "FALSE"
+        if kind == "date":
+            return value.isoformat(sep=" ")
+        return str(value)
+
+    def build(chunk):
+        columns = [[None] * len(chunk) for _ in range(width)]
+        for i, cells in enumerate(chunk):
+            for col, kind, value in cells:
+                if types[col] == pa.string() and kind != "str":
+                    value = to_text(kind, value)
+                columns[col][i] = value
+        return pa.record_batch(
+            [pa.array(values, type) for values, type in zip(columns, types)],
+            schema=schema,
+        )
+
+    def batches():
+        try:
+            rows = _xlsx_rows(xlsx, path, strings, date_styles, epoch)
+            if header:
+                next(rows, None)
+            chunk = []
+            for cells in rows:
+                chunk.append(cells)
+                if len(chunk) >= chunk_size:
+                    yield build(chunk)
+                    chunk = []
+            if chunk:
+                yield build(chunk)
+        finally:
+            xlsx.close()
+
+    return pa.RecordBatchReader.from_batches(schema, batches())
+
+
+@contextmanager
+def _registered(
+    con: duckdb.DuckDBPyConnection, name: str, reader: pa.RecordBatchReader
+) -> Iterator[None]:
+    """在连接上临时注册 RecordBatchReader 为视图，退出时注销。"""
+    con.register(name, reader)
+    try:
+        yield
+    finally:
+        con.unregister(name)
+
+
+def _select_members(
+    zip_ref: ZipFile,
+    filename: Optional[str] = None,
+    suffixes: List[str] = _ZIP2DB_SUFFIXES,
+) -> List[ZipInfo]:
+    """
+    选出 zip2db 需要导入的压缩包成员。
+
+    未指定文件名时选出根目录下全部支持格式的成员，按 ``suffixes`` 的顺序排列
+    （默认为 CSV、XLSX、Parquet、JSON，与 table 为列表时的对应顺序一致）。
+
+    Args:
+        zip_ref: 打开的 ZipFile 对象
+        filename: 指定的成员名
+        suffixes: 支持的扩展名
+
+    Returns:
+        List[ZipInfo]: 需要导入的成员
+    """
+    if filename:
+        return [m for m in zip_ref.infolist() if m.filename == filename]
+    members = [
+        m
+        for m in zip_ref.infolist()
+        if not m.is_dir()
+        and "/" not in m.filename
+        and Path(m.filename).suffix.lower() in suffixes
+    ]
+    return sorted(
+        members, key=lambda m: suffixes.index(Path(m.filename).suffix.lower())
+    )
+
+
+def _member_signature(member: ZipInfo, table_name: str) -> tuple:
+    """返回压缩包成员在清单中的签名：(CRC32, 大小, 修改时间, 目标表)。"""
+    return (member.CRC, member.file_size, datetime(*member.date_time), table_name)
+
+
+def _manifest_state(con: duckdb.DuckDBPyConnection, archive: str) -> Dict[str, tuple]:
+    """
+    读取清单表中某个压缩包已导入成员的签名，清单表不存在时先创建。
+
+    只返回目标表仍然存在的成员：目标表被删除后重新运行时，这些成员视为
+    尚未导入，会重新导入并建表。
+
+    Args:
+        con: DuckDB数据库连接
+        archive: 压缩包的绝对路径
+
+    Returns:
+        Dict[str, tuple]: {成员名: 签名}
+    """
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {MANIFEST_TABLE} (
+            archive VARCHAR,
+            member VARCHAR,
+            crc32 UBIGINT,
+            size UBIGINT,
+            mtime TIMESTAMP,
+            table_name VARCHAR,
+            loaded_at TIMESTAMP
+        )
+        """)
+    rows = con.execute(
+        f"SELECT member, crc32, size, mtime, table_name FROM {MANIFEST_TABLE} "
+        "WHERE archive = ? AND lower(table_name) IN ("
+        "SELECT lower(table_name) FROM duckdb_tables() "
+        "WHERE database_name = current_database() "
+        "AND schema_name = current_schema())",
+        [archive],
+    ).fetchall()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+def _record_manifest(
+    con: duckdb.DuckDBPyConnection,
+    archive: str,
+    loaded: List[Tuple[ZipInfo, str]],
+) -> None:
+    """
+    在清单表中记录（或更新）已成功导入的成员。
+
+    Args:
+        con: DuckDB数据库连接
+        archive: 压缩包的绝对路径
+        loaded: 已导入的 (成员, 目标表) 列表
+    """
+    loaded_at = datetime.now()
+    for member, table_name in loaded:
+        con.execute(
+            f"DELETE FROM {MANIFEST_TABLE} WHERE archive = ? AND member = ?",
+            [archive, member.filename],
+        )
+        con.execute(
+            f"INSERT INTO {MANIFEST_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                archive,
+                member.filename,
+                *_member_signature(member, table_name),
+                loaded_at,
+            ],
+        )
+
+
+def _schema_key(
+    name: str, files: List[Path], kwargs: Dict[str, Any]
+) -> Optional[Tuple[str, str, str]]:
+    """
+    计算 schema 缓存的键：(成员名模式, 表头哈希, 读取参数)。
+
+    成员名中的数字替换为 ``*``（如每日的 ``sales_20240101.csv`` 与
+    ``sales_20240102.csv`` 共用 ``sales_*.csv``）；CSV/TSV 取首行、按行分隔的
+    JSON 取首条记录的字段名计算哈希。多个文件的表头不一致、JSON 为数组格式，
+    或调用方已显式给出列（``columns``、``types`` 等）时不使用缓存，返回 None。
+
+    Args:
+        name: 成员名
+        files: 解压后的数据文件
+        kwargs: 读取参数
+
+    Returns:
+        Optional[Tuple[str, str, str]]: 缓存键
+    """
+    suffix = Path(name).suffix.lower()
+    if suffix not in (".csv", ".tsv", ".json") or _SCHEMA_CACHE_BYPASS & set(kwargs):
+        return None
+    hashes = set()
+    for data_file in files:
+        with open(data_file, "rb") as f:
+            header = f.readline(65536).rstrip(b"\r\n")
+        if suffix == ".json":
+            try:
+                record = json.loads(header)
+            except ValueError:
+                return None
+            if not isinstance(record, dict):
+                return None
+            header = "\x1f".join(sorted(record)).encode("utf-8")
+        hashes.add(hashlib.sha1(header).hexdigest())
+    if len(hashes) != 1:
+        return None
+    pattern = re.sub(r"\d+", "*", Path(name).name)
+    return pattern, hashes.pop(), ", ".join(_reader_options(kwargs))
+
+
+def _sniff_schema(
+    con: duckdb.DuckDBPyConnection, data_file: Path, kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    探测数据文件的格式与列类型，返回可直接传给读取函数的参数。
+
+    CSV/TSV 使用 ``sniff_csv`` 得到分隔符、表头、列类型与日期格式等，
+    并关闭自动探测（``auto_detect=false``）；JSON 返回探测得到的 ``columns``。
+
+    Args:
+        con: DuckDB数据库连接
+        data_file: 数据文件
+        kwargs: 读取参数
+
+    Returns:
+        Dict[str, Any]: 读取参数
+    """
+    options = "".join(f", {o}" for o in _reader_options(kwargs))
+    if data_file.suffix.lower() == ".json":
+        rows = con.execute(
+            f"DESCRIBE SELECT * FROM read_json_auto({_sql_literal(data_file)}{options})"
+        ).fetchall()
+        return {"columns": {row[0]: row[1] for row in rows}}
+
+    row = con.execute(
+        "SELECT Delimiter, Quote, Escape, NewLineDelimiter, Comment, SkipRows, "
+        "HasHeader, Columns, DateFormat, TimestampFormat "
+        f"FROM sniff_csv({_sql_literal(data_file)}{options})"
+    ).fetchone()
+    names = [
+        "delim",
+        "quote",
+        "escape",
+        "new_line",
+        "comment",
+        "skip",
+        "header",
+        "columns",
+        "dateformat",
+        "timestampformat",
+    ]
+    schema = {"auto_detect": False}
+    for name, value in zip(names, row):
+        # 样本中未出现的引号、转义与注释字符保留 DuckDB 的默认值
+        if value is None or value == "(empty)":
+            continue
+        if name == "columns":
+            value = {column["name"]: column["type"] for column in value}
+        schema[name] = value
+    return schema
+
+
+def _execute_with_schema(
+    con: duckdb.DuckDBPyConnection,
+    query: Callable[[Dict[str, Any]], str],
+    name: str,
+    files: List[Path],
+    kwargs: Dict[str, Any],
+    schema_cache: bool = False,
+) -> None:
+    """
+    执行读取数据文件的 SQL，可选地使用 schema 缓存跳过格式与类型探测。
+
+    ``schema_cache=True`` 时按 ``_schema_key`` 在 ``SCHEMA_CACHE_TABLE`` 中查找
+    已缓存的读取参数：命中时直接以显式的列和格式读取；未命中时探测一次并写入
+    缓存。命中时先由 ``_schema_fits`` 按缓存的参数试读样本行，失败（如新文件的
+    列类型发生变化）时删除该缓存，改用自动探测读取。试读在独立游标上进行，
+    不会中止调用方进行中的事务。XLSX 文件不使用缓存，由 ``_xlsx_reader`` 分块解析后
+    注册为 ``_XLSX_VIEW`` 视图再执行 SQL。
+
+    Args:
+        con: DuckDB数据库连接或游标
+        query: 接收读取参数、返回完整 SQL 的函数
+        name: 成员名
+        files: 解压后的数据文件
+        kwargs: 读取参数
+        schema_cache: 是否使用 schema 缓存
+    """
+    kwargs = _format_options(Path(name).suffix.lower(), kwargs)
+    if Path(name).suffix.lower() == ".xlsx":
+        with _registered(con, _XLSX_VIEW, _xlsx_reader(files[0], **kwargs)):
+            con.execute(query({}))
+        return
+
+    key = _schema_key(name, files, kwargs) if schema_cache else None
+    if key is None:
+        con.execute(query(kwargs))
+        return
+
+    row = con.execute(
+        f"SELECT schema FROM {SCHEMA_CACHE_TABLE} "
+        "WHERE pattern = ? AND header_hash = ? AND options = ? "
+        "ORDER BY updated_at DESC LIMIT 1",
+        list(key),
+    ).fetchone()
+    if row:
+        schema = json.loads(row[0])
+        if not _schema_fits(con, name, files, {**kwargs, **schema}):
+            con.execute(
+                f"DELETE FROM {SCHEMA_CACHE_TABLE} "
+                "WHERE pattern = ? AND header_hash = ? AND options = ?",
+                list(key),
+            )
+            con.execute(query(kwargs))
+            return
+    else:
+        try:
+            schema = _sniff_schema(con, files[0], kwargs)
+        except duckdb.Error:
+            con.execute(query(kwargs))
+            return
+        con.execute(
+            f"INSERT INTO {SCHEMA_CACHE_TABLE} VALUES (?, ?, ?, ?, current_timestamp)",
+            [*key, json.dumps(schema)],
+        )
+
+    try:
+        con.execute(query({**kwargs, **schema}))
+    except duckdb.Error as e:
+        print(f"按缓存的 schema 读取 {name} 失败，改用自动探测: {e}")
+        con.execute(
+            f"DELETE FROM {SCHEMA_CACHE_TABLE} "
+            "WHERE pattern = ? AND header_hash = ? AND options = ?",
+            list(key),
+        )
+        con.execute(query(kwargs))
+
+
+def _schema_fits(
+    con: duckdb.DuckDBPyConnection,
+    name: str,
+    files: List[Path],
+    options: Dict[str, Any],
+) -> bool:
+    """
+    按缓存的读取参数试读每个文件的样本行，检查缓存是否仍然适用。
+
+    样本行数与自动探测相同（``sample_size``，默认 20480 行）。试读在
+    ``con.cursor()`` 创建的独立游标上执行：DuckDB 事务中任一语句出错都会中止
+    整个事务，在 ``con`` 上直接读取失败后将无法回退到自动探测。
+
+    Args:
+        con: DuckDB数据库连接或游标
+        name: 成员名
+        files: 解压后的数据文件
+        options: 合并了缓存参数的读取参数
+
+    Returns:
+        bool: 全部文件都能按缓存的参数读取时为 True
+    """
+    suffix = Path(name).suffix.lower()
+    sample = options.get("sample_size", 20480)
+    limit = "" if sample == -1 else f" LIMIT {int(sample)}"
+    cursor = con.cursor()
+    try:
+        for data_file in files:
+            cursor.execute(
+                # 统计每一列，否则投影下推会跳过列的类型转换
+                "SELECT count(COLUMNS(*)) FROM (SELECT * FROM "
+                f"{_scan_sql(suffix, data_file, options)}{limit})"
+            ).fetchone()
+    except duckdb.Error as e:
+        print(f"按缓存的 schema 读取 {name} 失败，改用自动探测: {e}")
+        return False
+    finally:
+        cursor.close()
+    return True
+
+
+def _create_schema_cache(con: duckdb.DuckDBPyConnection) -> None:
+    """在数据库中创建 schema 缓存表（已存在时跳过）。"""
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {SCHEMA_CACHE_TABLE} (
+            pattern VARCHAR,
+            header_hash VARCHAR,
+            options VARCHAR,
+            schema VARCHAR,
+            updated_at TIMESTAMP
+        )
+        """)
+
+
+def _stream_zip2db(
+    zip_file: Path,
+    con: duckdb.DuckDBPyConnection,
+    selected: List[Tuple[ZipInfo, str]],
+    workers: int = 1,
+    **kwargs,
+) -> List[Tuple[ZipInfo, str]]:
+    """
+    zip2db 的流式模式：逐个成员经 ``ZipFile.open`` 读取并写入 DuckDB。
+
+    只读取需要导入的成员，不向临时目录写入任何文件。XLSX 需要随机读取工作簿中的
+    多个部件，仅将该成员单独解压到临时目录后分块导入。并发执行时每个线程单独打开压缩包。
+
+    Args:
+        zip_file: zip压缩包文件路径
+        con: DuckDB数据库连接
+        selected: 需要导入的 (成员, 表名) 列表
+        workers: 并发线程数
+        **kwargs: 传递给读取器的额外参数
+
+    Returns:
+        List[Tuple[ZipInfo, str]]: 成功导入的 (成员, 表名) 列表
+    """
+    local = threading.local()
+    handles = []
+
+    def create(cursor, member, table_name):
+        zip_ref = getattr(local, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = ZipFile(zip_file, "r")
+            handles.append(zip_ref)
+        if member.filename.lower().endswith(".xlsx"):
+            with TemporaryDirectory() as tmpdir:
+                data_file = Path(zip_ref.extract(member, tmpdir))
+                _execute_with_schema(
+                    cursor,
+                    lambda options: (
+                        f"CREATE TABLE {table_name} AS SELECT * FROM "
+                        f"{_scan_sql('.xlsx', data_file, options)}"
+                    ),
+                    member.filename,
+                    [data_file],
+                    kwargs,
+                )
+            return
+        with zip_ref.open(member) as f:
+            reader = _arrow_member_reader(
+                f, Path(member.filename).suffix.lower(), **kwargs
+            )
+            with _registered(cursor, "__zip2db_stream", reader):
+                cursor.execute(
+                    f"CREATE TABLE {table_name} AS SELECT * FROM __zip2db_stream"
+                )
+
+    loads = [
+        (
+            member.filename,
+            table_name,
+            lambda cursor, m=member, t=table_name: create(cursor, m, t),
+        )
+        for member, table_name in selected
+    ]
+    try:
+        done = _run_loads(con, loads, workers)
+    finally:
+        for zip_ref in handles:
+            zip_ref.close()
+    return [item for item, ok in zip(selected, done) if ok]
+
+
+def _extract_zip2db(
+    zip_file: Path,
+    con: duckdb.DuckDBPyConnection,
+    selected: List[Tuple[ZipInfo, str]],
+    workers: int = 1,
+    schema_cache: bool = False,
+    **kwargs,
+) -> List[Tuple[ZipInfo, str]]:
+    """
+    zip2db 的默认模式：将需要导入的成员解压到临时目录，再由DuckDB读取。
+
+    Args:
+        zip_file: zip压缩包文件路径
+        con: DuckDB数据库连接
+        selected: 需要导入的 (成员, 表名) 列表
+        workers: 并发线程数
+        schema_cache: 是否使用 schema 缓存
+        **kwargs: 传递给duckdb读取文件的额外参数
+
+    Returns:
+        List[Tuple[ZipInfo, str]]: 成功导入的 (成员, 表名) 列表
+    """
+    with TemporaryDirectory() as tmpdir:
+        with ZipFile(zip_file, "r") as zip_ref:
+            data_files = [
+                Path(zip_ref.extract(member, tmpdir)) for member, _ in selected
+            ]
+
+        loads, items = [], []
+        for (member, table_name), data_file in zip(selected, data_files):
+            suffix = data_file.suffix.lower()
+            if suffix not in _DATA_SUFFIXES:
+                continue
+
+            def create(cursor, name=member.filename, f=data_file, t=table_name):
+                _execute_with_schema(
+                    cursor,
+                    lambda options: (
+                        f"CREATE TABLE {t} AS SELECT * FROM "
+                        f"{_scan_sql(f.suffix.lower(), f, options)}"
+                    ),
+                    name,
+                    [f],
+                    kwargs,
+                    schema_cache,
+                )
+
+            loads.append((data_file.name, table_name, create))
+            items.append((member, table_name))
+
+        done = _run_loads(con, loads, workers)
+
+    return [item for item, ok in zip(items, done) if ok]
 
 
 def zip2db(
     zip_file: Path,
-    db_file: Path,
+    db_file: Union[Path, duckdb.DuckDBPyConnection],
     filename: Optional[str] = None,
     table: Optional[Union[Dict[str, str], List[str], str]] = None,
+    stream: bool = False,
+    workers: int = 1,
+    incremental: bool = False,
+    schema_cache: bool = False,
     **kwargs,
 ) -> duckdb.DuckDBPyConnection:
     """
@@ -40,15 +1250,40 @@ def zip2db(
 
     支持的数据格式: CSV、XLSX、Parquet、JSON
 
+    默认将需要导入的成员解压到临时目录再由DuckDB读取；``stream=True`` 时
+    逐个成员经 ``ZipFile.open`` 以 Arrow 记录批次流式写入DuckDB，
+    只读取需要导入的成员，不占用临时磁盘空间。
+
+    ``incremental=True`` 时在数据库的清单表（``MANIFEST_TABLE``）中记录每个
+    已导入成员的压缩包路径、成员名、CRC32、大小、修改时间和目标表，
+    再次运行时跳过未变化且目标表仍存在的成员，只重新导入新增或变化的成员。
+
+    ``schema_cache=True`` 时将CSV/JSON的探测结果（分隔符、表头、列类型、日期格式等）
+    按成员名模式和表头哈希缓存在数据库的 ``SCHEMA_CACHE_TABLE`` 表中，之后布局相同
+    的文件以显式的列和格式读取，不再抽样探测；按缓存读取失败时自动回退到探测。
+
     Args:
         zip_file: zip压缩包文件路径
-        db_file: DuckDB数据库文件路径
+        db_file: DuckDB数据库文件路径，也可以是已打开的DuckDB连接（见 ``bulk_load``）
         filename: 指定要读取的具体文件名，如果不指定则读取所有支持的数据文件
         table: 指定表名，可以是:
                - dict: {文件名: 表名} 的映射
                - list: 与文件顺序对应的表名列表
                - str: 单个表名（仅当读取单个文件时）
-        **kwargs: 传递给duckdb读取文件的额外参数
+        stream: 是否不解压、直接流式读取压缩包成员，默认 False。
+                流式模式下 CSV 由 pyarrow 解析，仅支持常用的读取参数
+                （delim、quote、escape、skip、encoding、names、nullstr、header）
+        workers: 并发导入的线程数，默认为 1 即依次导入。大于 1 时各文件
+                 通过独立游标（``con.cursor()``）同时解析和写入
+        incremental: 是否按清单表增量导入，默认 False 即全部重新导入
+        schema_cache: 是否缓存CSV/JSON的探测结果，默认 False。
+                      仅用于解压模式，流式模式由 pyarrow 解析，不使用缓存
+        **kwargs: 传递给duckdb读取文件的额外参数，按类型转换为SQL字面量：
+                  布尔值、数值、列表和字典（结构体）原样传递，
+                  如 ``header=True``、``sample_size=-1``、``types={'id': 'BIGINT'}``
+                  XLSX 由 ``_xlsx_reader`` 分块解析，只使用 ``sheet``、``header``、
+                  ``chunk_size``，不需要 spatial 扩展；``sheet``、``chunk_size``
+                  不会传给其他格式，可用于同时含有 CSV 等文件的压缩包
 
     Returns:
         duckdb.DuckDBPyConnection: DuckDB数据库连接对象
@@ -65,91 +1300,193 @@ def zip2db(
 
         >>> # 指定表名映射
         >>> con = zip2db('data.zip', 'output.db', table={'users.csv': '用户表'})
-    """
-    with TemporaryDirectory() as tmpdir:
-        with ZipFile(zip_file, "r") as zip_ref:
-            zip_ref.extractall(tmpdir)
 
-        tmpdir_path = Path(tmpdir)
+        >>> # 不解压，直接流式导入
+        >>> con = zip2db('data.zip', 'output.db', stream=True)
+
+        >>> # 8 个线程并发导入
+        >>> con = zip2db('data.zip', 'output.db', workers=8)
 
-        if filename:
-            data_files = [tmpdir_path / filename]
+        >>> # 增量导入，只处理新增或变化的文件
+        >>> con = zip2db('data.zip', 'output.db', incremental=True)
+
+        >>> # 每天布局相同的压缩包，复用上次的探测结果
+        >>> con = zip2db('daily.zip', 'output.db', schema_cache=True)
+
+        >>> # 显式给出列和类型，跳过大文件的自动探测
+        >>> con = zip2db('data.zip', 'output.db', filename='big.csv',
+        ...              header=True, columns={'id': 'BIGINT', 'name': 'VARCHAR'})
+    """
+    with ZipFile(zip_file, "r") as zip_ref:
+        members = _select_members(zip_ref, filename)
+
+    if not members:
+        raise ValueError("未找到支持的数据文件")
+
+    selected = []
+    for i, member in enumerate(members):
+        member_path = Path(member.filename)
+        table_name = _table_name(
+            table, member_path.name, member_path.stem, i, len(members)
+        )
+        selected.append((member, table_name))
+
+    con, owned = _connect(db_file)
+
+    with bulk_load(con, preserve_insertion_order=None) if owned else nullcontext():
+        if incremental:
+            archive = str(Path(zip_file).resolve())
+            state = _manifest_state(con, archive)
+            selected = [
+                (member, table_name)
+                for member, table_name in selected
+                if state.get(member.filename) != _member_signature(member, table_name)
+            ]
+
+        if stream:
+            loaded = _stream_zip2db(zip_file, con, selected, workers, **kwargs)
         else:
-            supported_extensions = ["*.csv", "*.xlsx", "*.parquet", "*.json"]
-            data_files = []
-            for ext in supported_extensions:
-                data_files.extend(tmpdir_path.glob(ext))
+            if schema_cache:
+                _create_schema_cache(con)
+            loaded = _extract_zip2db(
+                zip_file, con, selected, workers, schema_cache=schema_cache, **kwargs
+            )
 
-        if not data_files:
-            raise ValueError("未找到支持的数据文件")
+        if incremental:
+            _record_manifest(con, archive, loaded)
 
-        con = duckdb.connect(db_file)
+    return con
 
-        for i, data_file in enumerate(data_files):
-            if not data_file.exists():
-                continue
 
-            if isinstance(table, dict):
-                table_name = table.get(data_file.name)
-                if not table_name:
-                    table_name = data_file.stem
-            elif isinstance(table, list):
-                if i < len(table):
-                    table_name = table[i]
-                else:
-                    table_name = data_file.stem
-            elif isinstance(table, str) and len(data_files) == 1:
-                table_name = table
-            else:
-                table_name = data_file.stem
+def zip2parquet(
+    zip_file: Path,
+    output_dir: Path,
+    filename: Optional[str] = None,
+    stream: bool = False,
+    partition_by: Optional[Union[str, List[str]]] = None,
+    compression: str = "zstd",
+    row_group_size: Optional[int] = None,
+    **kwargs,
+) -> List[Path]:
+    """
+    将zip压缩包中的数据文件转换为Parquet文件，作为导入DuckDB表之外的另一种输出。
 
-            table_name = "".join(c for c in table_name if c.isalnum() or c == "_")
+    支持的数据格式: CSV、TSV、XLSX、Parquet、JSON
 
-            suffix = data_file.suffix.lower()
+    每个成员由DuckDB读取后经 ``COPY ... TO`` 写为压缩的Parquet文件，
+    之后的查询可以利用列式存储、谓词下推与分区裁剪，不必每次重新解析CSV。
+    ``stream=True`` 时与 zip2db 相同，不解压、以 Arrow 记录批次流式读取成员。
 
-            try:
-                kwargs_str = (
-                    ", ".join([f"{k}='{v}'" for k, v in kwargs.items()])
-                    if kwargs
-                    else ""
-                )
+    Args:
+        zip_file: zip压缩包文件路径
+        output_dir: 输出目录，不存在时自动创建
+        filename: 指定要转换的具体文件名，如果不指定则转换根目录下所有支持的数据文件
+        stream: 是否不解压、直接流式读取压缩包成员，默认 False
+        partition_by: 分区列，指定时每个成员输出为以 ``列=值`` 分级的目录
+                      （Hive 分区），否则输出为单个 ``文件名.parquet``
+        compression: 压缩算法，如 "zstd"、"snappy"、"gzip"，默认 "zstd"
+        row_group_size: 每个行组的行数，默认使用DuckDB的默认值
+        **kwargs: 传递给duckdb读取文件的额外参数
 
-                if suffix == ".csv":
-                    if kwargs_str:
-                        read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_csv_auto('{data_file}', {kwargs_str})"
-                    else:
-                        read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_csv_auto('{data_file}')"
-                elif suffix == ".xlsx":
-                    if kwargs_str:
-                        read_query = f"CREATE TABLE {table_name} AS SELECT * FROM st_read('{data_file}', {kwargs_str})"
-                    else:
-                        read_query = f"CREATE TABLE {table_name} AS SELECT * FROM st_read('{data_file}')"
-                elif suffix == ".parquet":
-                    if kwargs_str:
-                        read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_parquet('{data_file}', {kwargs_str})"
-                    else:
-                        read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_parquet('{data_file}')"
-                elif suffix == ".json":
-                    if kwargs_str:
-                        read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_json_auto('{data_file}', {kwargs_str})"
-                    else:
-                        read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_json_auto('{data_file}')"
-                else:
-                    continue
+    Returns:
+        List[Path]: 写出的Parquet文件（分区时为目录）
 
-                con.execute(f"DROP TABLE IF EXISTS {table_name}")
+    Raises:
+        ValueError: 当未找到支持的数据文件，或多个成员（如 ``a.csv`` 与 ``a.json``）
+                    会写到同一个输出路径时
 
-                con.execute(read_query.strip())
+    Examples:
+        >>> # 转换zip中所有数据文件
+        >>> files = zip2parquet('data.zip', 'parquet/')
 
-            except Exception as e:
-                print(f"处理文件 {data_file.name} 时出错: {e}")
-                continue
+        >>> # 按年月分区，每个行组 100000 行
+        >>> files = zip2parquet('sales.zip', 'parquet/', partition_by=['year', 'month'],
+        ...                     row_group_size=100_000)
 
-    return con
+        >>> # 之后直接查询Parquet文件
+        >>> duckdb.sql("SELECT * FROM 'parquet/sales/**/*.parquet' WHERE year = 2024")
+    """
+    output_dir = Path(output_dir)
+    with ZipFile(zip_file, "r") as zip_ref:
+        members = _select_members(zip_ref, filename, _DATA_SUFFIXES)
+
+    if not members:
+        raise ValueError("未找到支持的数据文件")
+
+    if isinstance(partition_by, str):
+        partition_by = [partition_by]
+
+    # 输出路径只取成员的文件名主干，重名的成员会互相覆盖，转换前先检查
+    targets = {}
+    for member in members:
+        stem = Path(member.filename).stem
+        target = output_dir / (stem if partition_by else f"{stem}.parquet")
+        targets.setdefault(target, []).append(member.filename)
+    conflicts = {t: names for t, names in targets.items() if len(names) > 1}
+    if conflicts:
+        detail = "; ".join(
+            f"{t.name}: {', '.join(names)}" for t, names in conflicts.items()
+        )
+        raise ValueError(f"多个成员会写到同一个输出路径: {detail}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    copy_options = ["FORMAT parquet", f"COMPRESSION {_sql_literal(compression)}"]
+    if row_group_size:
+        copy_options.append(f"ROW_GROUP_SIZE {int(row_group_size)}")
+    if partition_by:
+        columns = ", ".join('"{}"'.format(c.replace('"', '""')) for c in partition_by)
+        copy_options.append(f"PARTITION_BY ({columns}), OVERWRITE_OR_IGNORE true")
+    copy_options = ", ".join(copy_options)
+
+    written = []
+    con = duckdb.connect()
+    try:
+        with TemporaryDirectory() as tmpdir, ZipFile(zip_file, "r") as zip_ref:
+            for member, target in zip(members, targets):
+                suffix = Path(member.filename).suffix.lower()
+
+                try:
+                    if stream and suffix != ".xlsx":
+                        with zip_ref.open(member) as f:
+                            reader = _arrow_member_reader(f, suffix, **kwargs)
+                            with _registered(con, "__zip2parquet_stream", reader):
+                                con.execute(
+                                    "COPY (SELECT * FROM __zip2parquet_stream) "
+                                    f"TO {_sql_literal(target)} ({copy_options})"
+                                )
+                    else:
+                        data_file = Path(zip_ref.extract(member, tmpdir))
+                        try:
+                            _execute_with_schema(
+                                con,
+                                lambda options: (
+                                    "COPY (SELECT * FROM "
+                                    f"{_scan_sql(suffix, data_file, options)}) "
+                                    f"TO {_sql_literal(target)} ({copy_options})"
+                                ),
+                                member.filename,
+                                [data_file],
+                                kwargs,
+                            )
+                        finally:
+                            data_file.unlink(missing_ok=True)
+                except Exception as e:
+                    print(f"处理文件 {member.filename} 时出错: {e}")
+                    continue
+
+                written.append(target)
+    finally:
+        con.close()
+
+    return written
 
 
 def special2db(
-    data_path: Path, db_path: Path, table: Optional[str] = None, **kwargs
+    data_path: Path,
+    db_path: Union[Path, duckdb.DuckDBPyConnection],
+    table: Optional[str] = None,
+    workers: int = 1,
+    **kwargs,
 ) -> duckdb.DuckDBPyConnection:
     """
     将特殊格式的文件转换为DuckDB数据库。
@@ -161,8 +1498,9 @@ def special2db(
 
     Args:
         data_path: 包含数据文件的路径（文件或目录）
-        db_path: 输出的DuckDB数据库文件路径
+        db_path: 输出的DuckDB数据库文件路径，也可以是已打开的DuckDB连接
         table: 表名（如果是目录，每个文件对应一个表）
+        workers: 并发导入的线程数，默认为 1 即依次导入
         **kwargs: 传递给duckdb读取文件的额外参数
 
     Returns:
@@ -183,11 +1521,12 @@ def special2db(
 
         >>> # 指定编码和其他参数
         >>> con = special2db('data/data.tsv', 'output.db', encoding='utf-8', header=True)
+
+        >>> # 4 个线程并发导入目录中的文件
+        >>> con = special2db('data_directory', 'all_data.db', workers=4)
     """
     data_path = Path(data_path)
-    db_path = Path(db_path)
-
-    con = duckdb.connect(db_path)
+    con, owned = _connect(db_path)
 
     if data_path.is_file():
         suffix = data_path.suffix.lower()
@@ -205,6 +1544,7 @@ def special2db(
     if not data_files:
         raise ValueError("未找到支持的数据文件（tsv、avro、arrow）")
 
+    loads = []
     for i, data_file in enumerate(data_files):
         if not data_file.exists():
             continue
@@ -219,173 +1559,582 @@ def special2db(
         suffix = data_file.suffix.lower()
 
         try:
-            kwargs_str = (
-                ", ".join([f"{k}='{v}'" for k, v in kwargs.items()]) if kwargs else ""
-            )
+            kwargs_str = ", ".join(_reader_options(kwargs)) if kwargs else ""
 
             if suffix == ".tsv":
                 if kwargs_str:
-                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_csv_auto('{data_file}', delim='\\t', {kwargs_str})"
+                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_csv_auto({_sql_literal(data_file)}, delim='\\t', {kwargs_str})"
                 else:
-                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_csv_auto('{data_file}', delim='\\t')"
+                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_csv_auto({_sql_literal(data_file)}, delim='\\t')"
             elif suffix == ".avro":
                 if kwargs_str:
-                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_avro('{data_file}', {kwargs_str})"
+                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_avro({_sql_literal(data_file)}, {kwargs_str})"
                 else:
-                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_avro('{data_file}')"
+                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_avro({_sql_literal(data_file)})"
             elif suffix == ".arrow":
                 if kwargs_str:
-                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_arrow('{data_file}', {kwargs_str})"
+                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_arrow({_sql_literal(data_file)}, {kwargs_str})"
                 else:
-                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_arrow('{data_file}')"
+                    read_query = f"CREATE TABLE {table_name} AS SELECT * FROM read_arrow({_sql_literal(data_file)})"
             else:
                 continue
 
-            con.execute(f"DROP TABLE IF EXISTS {table_name}")
-
-            con.execute(read_query.strip())
+            loads.append(
+                (
+                    data_file.name,
+                    table_name,
+                    lambda cursor, q=read_query.strip(): cursor.execute(q),
+                )
+            )
 
         except Exception as e:
             print(f"处理文件 {data_file.name} 时出错: {e}")
             continue
 
+    with bulk_load(con, preserve_insertion_order=None) if owned else nullcontext():
+        _run_loads(con, loads, workers)
+
     return con
 
 
-def multizip2db(
+def _prefetch(
+    items: List[Any], func: Callable[[Any], Any], size: int = 0
+) -> Iterator[Future]:
+    """
+    按顺序对每一项执行 ``func``，依次产出对应的 Future。
+
+    ``size`` 大于 0 时由 ``size`` 个线程在后台提前执行其后的至多 ``size`` 项；
+    消费者每取走一项才提交下一项（背压），尚未取走的结果不会无限累积。
+    ``size`` 为 0 时在取出时才于当前线程执行。
+
+    Args:
+        items: 待处理的项
+        func: 处理函数
+        size: 预取的项数（线程数）
+
+    Yields:
+        Future: 与各项一一对应的结果，出错时保存异常
+    """
+    if size <= 0:
+        for item in items:
+            future = Future()
+            try:
+                future.set_result(func(item))
+            except Exception as e:
+                future.set_exception(e)
+            yield future
+        return
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=size) as pool:
+        pending = deque(pool.submit(func, item) for item in islice(items, size))
+        try:
+            while pending:
+                future = pending.popleft()
+                pending.extend(pool.submit(func, item) for item in islice(items, 1))
+                yield future
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+@contextmanager
+def _zip_extractor() -> Iterator[Callable[[Tuple[Path, ZipInfo, Path]], Path]]:
+    """
+    提供可在多个线程中调用的解压函数 ``extract((压缩包, 成员, 目标目录))``。
+
+    每个线程只保留最近打开的一个压缩包，成员按压缩包顺序解压时不必重复
+    读取压缩包目录；退出上下文时关闭全部压缩包。
+
+    成员由 ``ZipFile.open`` 读出后自行写入：Python 3.12 及以前的
+    ``ZipFile.extract`` 创建上级目录时不带 ``exist_ok``，多个线程解压同一目录下的
+    成员会抛出 ``FileExistsError``。与 ``ZipFile.extract`` 一样，成员名中的空段、
+    ``.`` 与 ``..`` 会被去掉，不会写到目标目录之外。
+
+    Yields:
+        Callable: 解压函数，返回解压后的文件路径
+    """
+    local = threading.local()
+    handles = []
+
+    def extract(job):
+        zip_path, member, target_dir = job
+        if getattr(local, "zip_path", None) != zip_path:
+            if getattr(local, "zip_ref", None) is not None:
+                local.zip_ref.close()
+            local.zip_ref = ZipFile(zip_path, "r")
+            local.zip_path = zip_path
+            handles.append(local.zip_ref)
+        parts = [p for p in member.filename.split("/") if p not in ("", ".", "..")]
+        target = Path(target_dir, *parts)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with local.zip_ref.open(member) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        return target
+
+    try:
+        yield extract
+    finally:
+        for zip_ref in handles:
+            zip_ref.close()
+
+
+def _match_member(name: str, pattern: str) -> bool:
+    """
+    判断压缩包成员名是否与通配符匹配，按目录层级逐级匹配，与 ``Path.glob`` 一致。
+
+    Args:
+        name: 成员名（以 ``/`` 分隔目录）
+        pattern: 通配符
+
+    Returns:
+        bool: 是否匹配
+    """
+    parts, pattern_parts = name.split("/"), pattern.split("/")
+    return len(parts) == len(pattern_parts) and all(
+        fnmatchcase(part, pat) for part, pat in zip(parts, pattern_parts)
+    )
+
+
+def _bulk_multizip2db(
+    con: duckdb.DuckDBPyConnection,
     ziplist: list[Path],
-    filenames: str | list[str],
-    db_path: Optional[Path] = None,
-    table: Optional[str] = None,
+    filenames: list[str],
+    table: Optional[str],
+    incremental: bool = False,
+    schema_cache: bool = False,
+    prefetch: int = 0,
     **kwargs,
-) -> duckdb.DuckDBPyConnection:
+) -> None:
     """
-    将多个压缩包中指定的文件的数据合并后转换到DuckDB数据库中。
+    multizip2db 的批量模式：先收集全部匹配的成员，每个表每种格式只执行一次多文件扫描。
 
-    主要支持的数据格式: TSV、CSV、XLSX、Parquet、JSON
-
-    注意:
-        1. 每个压缩包中的文件会被合并到一个表中
-        2. 如果指定了表名，所有数据将合并到该表中
-        3. 如果未指定表名，每个文件将使用其文件名（不含扩展名）作为表名
+    各压缩包只解压匹配的成员（互不覆盖），再以 ``read_csv_auto([...])`` 等
+    多文件读取一次导入，由 DuckDB 跨文件并行解析，并按列名合并不同文件的列
+    （``union_by_name``）。结果增加 ``SOURCE_COLUMN`` 列，记录数据来源
+    （``压缩包的绝对路径/成员名``，与清单表中的压缩包一致）。
+    XLSX 成员无法多文件扫描，逐个按列名追加。
+    每个表在一个事务中导入，任一文件出错时该表的本次导入整体回滚。
 
     Args:
+        con: DuckDB数据库连接
         ziplist: 包含压缩包路径的列表
-        filenames: 要处理的文件名（支持通配符）
-        db_path: DuckDB数据库文件路径，默认为内存数据库
-        table: 可选的表名，默认使用文件名（不含扩展名）
+        filenames: 要处理的文件名通配符列表
+        table: 可选的表名
+        incremental: 是否按清单表增量导入
+        schema_cache: 是否使用 schema 缓存（同一组文件表头一致时生效）
+        prefetch: 并发解压的线程数，默认 0 即依次解压
         **kwargs: 传递给duckdb读取文件的额外参数
+    """
 
-    Returns:
-        duckdb.DuckDBPyConnection: DuckDB数据库连接对象
+    with TemporaryDirectory() as tmpdir:
+        tmpdir_path = Path(tmpdir)
+        # 需要解压的成员：[(压缩包, 成员, 目标目录), ...]
+        jobs: List[Tuple[Path, ZipInfo, Path]] = []
+        # {(表名, 扩展名): [(解压任务序号, 压缩包, 成员, 是否为变化的成员), ...]}
+        groups: Dict[Tuple[str, str], List[Tuple[Any, str, ZipInfo, bool]]] = {}
+        # 各序号对应压缩包的绝对路径，与清单表中的压缩包一致
+        resolved = [""] * len(ziplist)
+        for i, zip_path in enumerate(ziplist):
+            zip_path = Path(zip_path)
+            if not zip_path.exists():
+                print(f"压缩包不存在: {zip_path}")
+                continue
+            archive = resolved[i] = str(zip_path.resolve())
+            state = _manifest_state(con, archive) if incremental else {}
+            target_dir = tmpdir_path / str(i)
+            with ZipFile(zip_path, "r") as zip_ref:
+                for member in zip_ref.infolist():
+                    suffix = Path(member.filename).suffix.lower()
+                    if member.is_dir() or not any(
+                        _match_member(member.filename, pattern) for pattern in filenames
+                    ):
+                        continue
+                    if suffix not in _DATA_SUFFIXES:
+                        continue
+                    table_name = "".join(
+                        c
+                        for c in (table or Path(member.filename).stem)
+                        if c.isalnum() or c == "_"
+                    )
+                    if state.get(member.filename) == _member_signature(
+                        member, table_name
+                    ):
+                        continue
+                    jobs.append((zip_path, member, target_dir))
+                    groups.setdefault((table_name, suffix), []).append(
+                        (len(jobs) - 1, archive, member, member.filename in state)
+                    )
+
+        with _zip_extractor() as extract:
+            paths = [
+                future.result().as_posix()
+                for future in _prefetch(jobs, extract, prefetch)
+            ]
+        for entries in groups.values():
+            entries[:] = [(paths[k], *rest) for k, *rest in entries]
+
+        # 解压路径为 临时目录/序号/成员名，将序号换成压缩包的绝对路径得到数据来源，
+        # 不同目录下的同名压缩包互不混淆
+        relative = f"{SOURCE_COLUMN}[{len(tmpdir_path.as_posix()) + 2}:]"
+        source = (
+            f"{_sql_literal(resolved)}[split_part({relative}, '/', 1)::INTEGER + 1]"
+            f" || '/' || regexp_replace({relative}, '^[0-9]+/', '')"
+        )
+
+        for (table_name, suffix), entries in groups.items():
+            files = [f for f, _, _, _ in entries]
+            sources = [f"{a}/{m.filename}" for _, a, m, _ in entries]
+            try:
+                if suffix == ".xlsx":
+                    # (成员名, 文件, 接收读取参数返回 SELECT 语句的函数)
+                    scans = [
+                        (
+                            m.filename,
+                            [Path(f)],
+                            lambda options, f=f, s=s: (
+                                f"SELECT *, {_sql_literal(s)} AS {SOURCE_COLUMN} "
+                                f"FROM {_scan_sql(suffix, f, options)}"
+                            ),
+                        )
+                        for (f, _, m, _), s in zip(entries, sources)
+                    ]
+                else:
+                    scans = [
+                        (
+                            entries[0][2].filename,
+                            [Path(f) for f in files],
+                            lambda options: (
+                                f"SELECT * REPLACE ({source} AS {SOURCE_COLUMN}) FROM "
+                                + _scan_sql(
+                                    suffix,
+                                    files,
+                                    {
+                                        "union_by_name": True,
+                                        "filename": SOURCE_COLUMN,
+                                        **options,
+                                    },
+                                )
+                            ),
+                        )
+                    ]
+
+                # 每个表的数据（含删除变化成员的旧数据与清单记录）在一个事务中导入，
+                # 任一文件出错时整组回滚，不会留下没有清单记录的部分数据
+                def load_group():
+                    existing = con.execute(
+                        "SELECT column_name FROM duckdb_columns() WHERE table_name = ?",
+                        [table_name],
+                    ).fetchall()
+                    changed = [s for s, entry in zip(sources, entries) if entry[3]]
+                    if changed and (SOURCE_COLUMN,) in existing:
+                        con.execute(
+                            f"DELETE FROM {table_name} WHERE {SOURCE_COLUMN} IN "
+                            f"(SELECT unnest(?::VARCHAR[]))",
+                            [changed],
+                        )
+                    if existing and (SOURCE_COLUMN,) not in existing:
+                        # 已有的表由默认模式建立、没有来源列时先补上，旧数据的来源为 NULL
+                        con.execute(
+                            f"ALTER TABLE {table_name} "
+                            f"ADD COLUMN {SOURCE_COLUMN} VARCHAR"
+                        )
+                    for name, paths, query in scans:
+                        statement = (
+                            f"INSERT INTO {table_name} BY NAME "
+                            if existing
+                            else f"CREATE TABLE {table_name} AS "
+                        )
+                        _execute_with_schema(
+                            con,
+                            lambda options, q=query, st=statement: st + q(options),
+                            name,
+                            paths,
+                            kwargs,
+                            schema_cache,
+                        )
+                        existing = [(SOURCE_COLUMN,)]
+                    if incremental:
+                        for archive in dict.fromkeys(a for _, a, _, _ in entries):
+                            _record_manifest(
+                                con,
+                                archive,
+                                [
+                                    (m, table_name)
+                                    for _, a, m, _ in entries
+                                    if a == archive
+                                ],
+                            )
 
-    Examples:
-        >>> # 从多个zip中读取同名文件并合并
-        >>> con = multizip2db(['data1.zip', 'data2.zip'], 'users.csv', 'merged.db')
+                with _transaction(con):
+                    load_group()
+            except Exception as e:
+                print(f"处理表 {table_name} 的 {len(files)} 个文件时出错，已回滚: {e}")
+                continue
 
-        >>> # 使用通配符匹配文件
-        >>> con = multizip2db(['data1.zip', 'data2.zip'], '*.csv', 'all_data.db', table='combined')
+
+def _per_file_multizip2db(
+    con: duckdb.DuckDBPyConnection,
+    ziplist: list[Path],
+    filenames: list[str],
+    table: Optional[str],
+    incremental: bool = False,
+    schema_cache: bool = False,
+    prefetch: int = 0,
+    **kwargs,
+) -> None:
     """
-    if isinstance(filenames, str):
-        filenames = [filenames]
+    multizip2db 的默认模式：逐个成员解压后导入。
 
-    if db_path is None:
-        db_path = ":memory:"
-    else:
-        db_path = Path(db_path)
-    con = duckdb.connect(db_path)
+    每个压缩包的全部成员在一个事务中导入（见 ``_in_transaction``）。
+    ``prefetch`` 大于 0 时由线程池提前解压其后的成员（可跨压缩包），导入仍由
+    当前连接按顺序执行；已解压、尚未导入的文件不超过 ``prefetch`` 个加上当前
+    压缩包的成员，导入完即删除，以此限制临时磁盘占用。
 
-    try:
-        with TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
+    Args:
+        con: DuckDB数据库连接
+        ziplist: 包含压缩包路径的列表
+        filenames: 要处理的文件名通配符列表
+        table: 可选的表名
+        incremental: 是否按清单表增量导入
+        schema_cache: 是否使用 schema 缓存
+        prefetch: 并发解压的线程数，默认 0 即依次解压
+        **kwargs: 传递给duckdb读取文件的额外参数
+    """
+    # [(压缩包, 压缩包的绝对路径, [(成员, 表名), ...]), ...]
+    archives = []
+    # {压缩包的绝对路径: 清单表中已导入的成员}
+    states: Dict[str, Dict[str, tuple]] = {}
+    for zip_path in ziplist:
+        zip_path = Path(zip_path)
+        if not zip_path.exists():
+            print(f"压缩包不存在: {zip_path}")
+            continue
 
-            for zip_path in ziplist:
-                if not zip_path.exists():
-                    print(f"压缩包不存在: {zip_path}")
-                    continue
+        archive = str(zip_path.resolve())
+        state = states[archive] = _manifest_state(con, archive) if incremental else {}
+        selected, seen = [], set()
+
+        with ZipFile(zip_path, "r") as zip_ref:
+            for filename_pattern in filenames:
+                for member in zip_ref.infolist():
+                    if (
+                        member.is_dir()
+                        or member.filename in seen
+                        or not _match_member(member.filename, filename_pattern)
+                    ):
+                        continue
+                    seen.add(member.filename)
+
+                    if Path(member.filename).suffix.lower() not in _DATA_SUFFIXES:
+                        continue
+
+                    if table:
+                        table_name = table
+                    else:
+                        table_name = Path(member.filename).stem
 
-                with ZipFile(zip_path, "r") as zip_ref:
-                    zip_ref.extractall(tmpdir_path)
+                    table_name = "".join(
+                        c for c in table_name if c.isalnum() or c == "_"
+                    )
 
-                    for filename_pattern in filenames:
-                        matched_files = list(tmpdir_path.glob(filename_pattern))
+                    if incremental:
+                        signature = _member_signature(member, table_name)
+                        if state.get(member.filename) == signature:
+                            continue
 
-                        for data_file in matched_files:
-                            if not data_file.is_file():
-                                continue
+                    selected.append((member, table_name))
 
-                            if table:
-                                table_name = table
-                            else:
-                                table_name = data_file.stem
+        archives.append((zip_path, archive, selected))
 
-                            table_name = "".join(
-                                c for c in table_name if c.isalnum() or c == "_"
-                            )
+    try:
+        with TemporaryDirectory() as tmpdir, _zip_extractor() as extract:
+            # 各压缩包解压到单独的目录，并发解压同名成员时互不覆盖
+            jobs = [
+                (zip_path, member, Path(tmpdir) / str(i))
+                for i, (zip_path, _, selected) in enumerate(archives)
+                for member, _ in selected
+            ]
+            extracted = _prefetch(jobs, extract, prefetch)
+            try:
+                for zip_path, archive, selected in archives:
+                    futures = []
 
-                            suffix = data_file.suffix.lower()
+                    def data_file(k):
+                        while len(futures) <= k:
+                            futures.append(next(extracted))
+                        return futures[k].result()
 
+                    def load_archive(strict):
+                        loaded = []
+
+                        for k, (member, table_name) in enumerate(selected):
                             try:
-                                kwargs_str = (
-                                    ", ".join([f"{k}='{v}'" for k, v in kwargs.items()])
-                                    if kwargs
-                                    else ""
+                                path = data_file(k)
+                                suffix = path.suffix.lower()
+
+                                columns = {
+                                    c
+                                    for (c,) in con.execute(
+                                        "SELECT column_name FROM duckdb_columns() "
+                                        "WHERE table_name = ?",
+                                        [table_name],
+                                    ).fetchall()
+                                }
+                                # 增量导入时记录数据来源，成员变化后据此删除旧数据
+                                tracked = incremental and (
+                                    not columns or SOURCE_COLUMN in columns
                                 )
-
-                                if suffix == ".csv":
-                                    if kwargs_str:
-                                        read_query = f"SELECT * FROM read_csv_auto('{data_file}', {kwargs_str})"
-                                    else:
-                                        read_query = f"SELECT * FROM read_csv_auto('{data_file}')"
-                                elif suffix == ".xlsx":
-                                    if kwargs_str:
-                                        read_query = f"SELECT * FROM st_read('{data_file}', {kwargs_str})"
-                                    else:
-                                        read_query = (
-                                            f"SELECT * FROM st_read('{data_file}')"
+                                source = f"{archive}/{member.filename}"
+                                if member.filename in states[archive]:
+                                    if not tracked:
+                                        print(
+                                            f"警告：{member.filename} 已变化，"
+                                            f"{table_name} 中没有 {SOURCE_COLUMN} 列，"
+                                            "无法替换旧数据，已跳过"
                                         )
-                                elif suffix == ".parquet":
-                                    if kwargs_str:
-                                        read_query = f"SELECT * FROM read_parquet('{data_file}', {kwargs_str})"
-                                    else:
-                                        read_query = (
-                                            f"SELECT * FROM read_parquet('{data_file}')"
-                                        )
-                                elif suffix == ".json":
-                                    if kwargs_str:
-                                        read_query = f"SELECT * FROM read_json_auto('{data_file}', {kwargs_str})"
-                                    else:
-                                        read_query = f"SELECT * FROM read_json_auto('{data_file}')"
-                                elif suffix == ".tsv":
-                                    if kwargs_str:
-                                        read_query = f"SELECT * FROM read_csv_auto('{data_file}', delim='\\t', {kwargs_str})"
-                                    else:
-                                        read_query = f"SELECT * FROM read_csv_auto('{data_file}', delim='\\t')"
-                                else:
-                                    continue
-
-                                existing_tables = con.execute("SHOW TABLES").fetchall()
-                                table_exists = any(
-                                    table_name == t[0] for t in existing_tables
-                                )
-
-                                if table_exists:
+                                        continue
                                     con.execute(
-                                        f"INSERT INTO {table_name} {read_query}"
+                                        f"DELETE FROM {table_name} "
+                                        f"WHERE {SOURCE_COLUMN} = ?",
+                                        [source],
                                     )
+
+                                if columns:
+                                    statement = f"INSERT INTO {table_name} BY NAME "
                                 else:
-                                    con.execute(
-                                        f"CREATE TABLE {table_name} AS {read_query}"
+                                    statement = f"CREATE TABLE {table_name} AS "
+                                if tracked:
+                                    select = (
+                                        f"SELECT *, {_sql_literal(source)} "
+                                        f"AS {SOURCE_COLUMN} FROM "
                                     )
+                                else:
+                                    select = "SELECT * FROM "
+
+                                _execute_with_schema(
+                                    con,
+                                    lambda options: (
+                                        f"{statement}{select}"
+                                        f"{_scan_sql(suffix, path, options)}"
+                                    ),
+                                    member.filename,
+                                    [path],
+                                    kwargs,
+                                    schema_cache,
+                                )
 
                             except Exception as e:
-                                print(f"处理文件 {data_file.name} 时出错: {e}")
+                                if strict:
+                                    raise
+                                print(f"处理文件 {member.filename} 时出错: {e}")
                                 continue
 
-                            data_file.unlink(missing_ok=True)
+                            loaded.append((member, table_name))
+
+                        if incremental:
+                            _record_manifest(con, archive, loaded)
+
+                    _in_transaction(con, load_archive)
+
+                    for future in futures:
+                        if future.exception() is None:
+                            future.result().unlink(missing_ok=True)
+            finally:
+                # 出错时取消尚未开始的解压，等待进行中的解压结束后再清理临时目录
+                extracted.close()
 
     except Exception as e:
         print(f"处理压缩包时出错: {e}")
         raise
 
+
+def multizip2db(
+    ziplist: list[Path],
+    filenames: str | list[str],
+    db_path: Optional[Union[Path, duckdb.DuckDBPyConnection]] = None,
+    table: Optional[str] = None,
+    bulk: bool = False,
+    incremental: bool = False,
+    schema_cache: bool = False,
+    prefetch: int = 0,
+    **kwargs,
+) -> duckdb.DuckDBPyConnection:
+    """
+    将多个压缩包中指定的文件的数据合并后转换到DuckDB数据库中。
+
+    主要支持的数据格式: TSV、CSV、XLSX、Parquet、JSON
+
+    注意:
+        1. 每个压缩包中的文件会被合并到一个表中
+        2. 如果指定了表名，所有数据将合并到该表中
+        3. 如果未指定表名，每个文件将使用其文件名（不含扩展名）作为表名
+        4. ``bulk=True`` 时先收集全部匹配的文件，每个表每种格式只执行一次
+           多文件读取，由DuckDB跨文件并行解析并按列名合并，
+           结果增加记录数据来源（``压缩包的绝对路径/成员名``）的 ``_source_file`` 列
+           （``SOURCE_COLUMN``，数据中已有的 ``filename`` 等列保持不变）；
+           追加到没有该列的已有表时先补上该列，之前导入的数据的来源为 NULL
+        5. ``incremental=True`` 时按清单表（``MANIFEST_TABLE``）跳过已导入且未变化的
+           成员，只追加新增或变化的成员。增量导入的表同样带有 ``_source_file`` 列，
+           变化成员的旧数据按该列删除后重新导入；表中没有该列（如以非增量方式
+           创建）时无法区分旧数据，输出警告并跳过该成员，不会重复追加
+        6. ``schema_cache=True`` 时缓存CSV/JSON的探测结果，见 ``zip2db``
+        7. ``prefetch`` 大于 0 时由线程池并发解压多个压缩包的成员，导入仍按顺序
+           由同一连接执行；逐个文件导入时最多提前解压 ``prefetch`` 个成员
+
+    Args:
+        ziplist: 包含压缩包路径的列表
+        filenames: 要处理的文件名（支持通配符）
+        db_path: DuckDB数据库文件路径或已打开的DuckDB连接，默认为内存数据库
+        table: 可选的表名，默认使用文件名（不含扩展名）
+        bulk: 是否使用批量多文件读取，默认 False 即逐个文件导入
+        incremental: 是否按清单表增量导入，默认 False 即全部导入
+        schema_cache: 是否缓存CSV/JSON的探测结果，默认 False
+        prefetch: 并发解压的线程数，默认 0 即依次解压
+        **kwargs: 传递给duckdb读取文件的额外参数；XLSX 只使用 ``sheet``、``header``、
+                  ``chunk_size``，这些 XLSX 专用参数不会传给其他格式
+
+    Returns:
+        duckdb.DuckDBPyConnection: DuckDB数据库连接对象
+
+    Examples:
+        >>> # 从多个zip中读取同名文件并合并
+        >>> con = multizip2db(['data1.zip', 'data2.zip'], 'users.csv', 'merged.db')
+
+        >>> # 使用通配符匹配文件
+        >>> con = multizip2db(['data1.zip', 'data2.zip'], '*.csv', 'all_data.db', table='combined')
+
+        >>> # 一次多文件读取导入全部压缩包中的文件
+        >>> con = multizip2db(zips, '*.csv', 'all_data.db', table='combined', bulk=True)
+
+        >>> # 8 个线程并发解压，边解压边导入
+        >>> con = multizip2db(zips, '*.csv', 'all_data.db', prefetch=8)
+
+        >>> # 每天只导入新增的文件
+        >>> con = multizip2db(zips, '*.csv', 'all_data.db', bulk=True, incremental=True)
+    """
+    if isinstance(filenames, str):
+        filenames = [filenames]
+
+    con, owned = _connect(":memory:" if db_path is None else db_path)
+
+    with bulk_load(con, preserve_insertion_order=None) if owned else nullcontext():
+        if schema_cache:
+            _create_schema_cache(con)
+
+        if bulk:
+            loader = _bulk_multizip2db
+        else:
+            loader = _per_file_multizip2db
+        loader(
+            con,
+            ziplist,
+            filenames,
+            table,
+            incremental,
+            schema_cache,
+            prefetch,
+            **kwargs,
+        )
+
     return con
@@ -1,6 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import re
+
 import pytest
 import polars as pl
-from simtoolsz.countrycode import CountryCode, country_convert, is_data_container
+from simtoolsz.countrycode import (
+    _artifact_is_current,
+    BULK_MIN_SIZE,
+    CountryCode,
+    build_reference_artifact,
+    codedata,
+    country_convert,
+    is_data_container,
+)
 
 
 class TestCountryCode:
@@ -26,6 +38,52 @@ class TestCountryCode:
         assert isinstance(core_classes, list)
         assert len(core_classes) > 0
 
+    def test_shared(self):
+        """测试共享实例"""
+        shared = CountryCode.shared()
+        assert shared is CountryCode.shared()
+        assert shared is not self.converter
+        # 正则表达式延迟到首次使用时编译
+        assert not CountryCode()._matchers
+
+    def test_result_cache(self):
+        """测试转换结果缓存"""
+        assert self.converter.cache_info() == {}
+
+        cached = CountryCode(cache_size=16)
+        assert cached.convert(["CHN", "CHN", "CN"], source="auto") == ["中国"] * 3
+        info = cached.cache_info()
+        assert info["convert"].hits == 1
+        assert info["guess_source"].misses == 2
+
+        cached.cache_clear()
+        assert cached.cache_info()["convert"].currsize == 0
+
+    def test_immutable(self):
+        """测试实例构造后不可修改，可在多线程间共享"""
+        converter = CountryCode()
+        with pytest.raises(AttributeError):
+            converter._frame = None
+        with pytest.raises(AttributeError):
+            del converter._index
+
+        codes = ["CHN", "US", "156", "Japan"] * 50
+        expected = CountryCode().convert(codes, target="ISO3")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda _: converter.convert(codes, target="ISO3"), range(16))
+            )
+        assert all(result == expected for result in results)
+
+    def test_bulk_convert(self):
+        """测试大批量输入交给 Polars 引擎转换"""
+        codes = ["CHN", "USA", "XYZ", None] * (BULK_MIN_SIZE // 4)
+        result = self.converter.covert_series(
+            codes, source="ISO3", target="ISO2", not_found="未知", out_type="list"
+        )
+        assert result[:4] == ["CN", "US", "未知", "未知"]
+        assert len(result) == len(codes)
+
     def test_search_info(self):
         """测试search_info静态方法"""
         result = CountryCode.search_info("ISO2")
@@ -49,6 +107,11 @@ class TestCountryCode:
         assert self.converter._get_valid_codename("ISO2") == "ISO2"
         assert self.converter._get_valid_codename("alpha_2") == "ISO2"
         assert self.converter._get_valid_codename("ISO_2") == "ISO2"
+        # 别名不区分大小写，完全同名的数据列优先
+        assert self.converter._get_valid_codename("m49") == "UNcode"
+        assert self.converter._get_valid_codename("UN") == "UN"
+        with pytest.raises(ValueError):
+            self.converter._get_valid_codename("not_a_column")
 
     def test_convert(self):
         """测试convert方法"""
@@ -70,6 +133,74 @@ class TestCountryCode:
         )
         assert result == "未知"
 
+        # 源格式与目标格式的别名
+        assert self.converter.convert("CHN", source="iso3", target="中文") == "中国"
+        with pytest.raises(ValueError):
+            self.converter.convert("CHN", source="ISO3", target="invalid_format")
+
+    def test_index_lookup(self):
+        """测试哈希索引精确查找"""
+        assert len(self.converter._find_rows("CHN", "ISO3")) == 1
+        assert "ISO3" in self.converter._index
+        assert self.converter._find_rows("ZZZ", "ISO3") == []
+
+        # 数字列支持字符串形式的数字
+        assert self.converter.convert(156, source="ISOnumeric") == "中国"
+        assert self.converter.convert("156", source="auto") == "中国"
+        # int() 不接受的写法按原样查找，不会抛出异常
+        for txt in ("+-1", "²", "1_56"):
+            assert (
+                self.converter.convert(txt, source="ISOnumeric", not_found="-") == "-"
+            )
+
+        result = self.converter._lazy_find("USA", "ISO3")
+        assert isinstance(result, pl.DataFrame)
+        assert result["ISO2"].item() == "US"
+
+    def test_lookup_without_polars(self, monkeypatch):
+        """测试建立索引后，逐个查找不再访问 DataFrame（如每次重建的 schema）"""
+        self.converter.convert(["CHN", "156"], source="ISO3")
+        self.converter.convert("156", source="ISOnumeric")
+        monkeypatch.setattr(
+            pl.DataFrame,
+            "schema",
+            property(lambda frame: pytest.fail("查找时不应访问 DataFrame.schema")),
+        )
+        assert self.converter.convert("USA", source="ISO3", target="ISO2") == "US"
+        assert (
+            self.converter.convert("840", source="ISOnumeric", target="ISO3") == "USA"
+        )
+
+    def test_find_all(self):
+        """测试返回全部匹配记录"""
+        result = self.converter.find_all("China and Japan", use_regex=True)
+        assert isinstance(result, pl.DataFrame)
+        assert result["ISO3"].to_list() == ["CHN", "JPN"]
+        assert self.converter.find_all("CN")["ISO3"].to_list() == ["CHN"]
+        assert self.converter.find_all(156, source="ISOnumeric").height == 1
+        assert self.converter.find_all("ZZ").is_empty()
+
+    def test_regex_index(self):
+        """测试正则匹配索引与逐个匹配的结果一致"""
+        texts = [
+            "People's Republic of China",
+            "Republic of Korea",
+            "DR Congo",
+            "İNDIA",
+            "united states of america",
+            "xyz",
+        ]
+        patterns = [
+            (i, re.compile(entry, re.IGNORECASE))
+            for i, entry in enumerate(self.converter._frame["regex"])
+            if entry is not None
+        ]
+        for txt in texts:
+            expected = [i for i, rex in patterns if rex.search(txt)]
+            assert self.converter._find_rows(txt, "regex", use_regex=True) == expected
+
+        assert self.converter.convert("china", use_regex=True) == "中国"
+
     def test_covert_series(self):
         """测试covert_series方法"""
         # 测试转换列表
@@ -94,6 +225,143 @@ class TestCountryCode:
         assert isinstance(result, pl.DataFrame)
         assert len(result) == 3
 
+        # 整列转换与逐个转换的结果不随容器类型变化
+        codes = [" 156", "840 ", "156.5", "abc"]
+        expected = self.converter.convert(codes, source="ISOnumeric", target="ISO3")
+        assert expected == ["CHN", "USA", None, None]
+        result = self.converter.covert_series(
+            pl.Series(codes), source="ISOnumeric", target="ISO3", out_type="list"
+        )
+        assert result == expected
+
+    def test_convert_frame(self):
+        """测试convert_frame按列转换"""
+        df = pl.DataFrame({"iso3": ["CHN", "USA", None, "XYZ"]})
+        result = self.converter.convert_frame(
+            df, "iso3", source="ISO3", target="ISO2", not_found="未知"
+        )
+        assert isinstance(result, pl.DataFrame)
+        assert result["ISO2"].to_list() == ["CN", "US", "未知", "未知"]
+
+        # LazyFrame 保持惰性
+        lazy = self.converter.convert_frame(
+            df.lazy(), "iso3", target="name_zh", alias="名称"
+        )
+        assert isinstance(lazy, pl.LazyFrame)
+        assert lazy.collect()["名称"].to_list()[:2] == ["中国", "美国"]
+
+        # 自动识别源格式
+        result = self.converter.convert_frame(
+            pl.DataFrame({"code": ["CN", "USA"]}), "code", source="auto"
+        )
+        assert result["name_zh"].to_list() == ["中国", "美国"]
+
+        # 混合格式的列整列识别，结果与逐个转换一致
+        codes = ["CN", "USA", "156", " 840 ", "China", "ZZ"]
+        result = self.converter.convert_frame(
+            pl.DataFrame({"code": codes}), "code", source="auto", target="ISO3"
+        )
+        assert result["ISO3"].to_list() == self.converter.convert(
+            codes, source="auto", target="ISO3"
+        )
+
+        # 浮点列（如含缺失值的整数列）按数字代码识别，只接受整数值
+        numbers = pl.DataFrame({"code": [156.0, 840.0, None, 156.5]})
+        result = self.converter.convert_frame(
+            numbers, "code", source="auto", target="ISO3"
+        )
+        assert result["ISO3"].to_list() == ["CHN", "USA", None, None]
+        assert self.converter.convert([156.0, 840.0], target="ISO3") == ["CHN", "USA"]
+
+    def test_convert_many(self):
+        """测试一次转换为多种格式"""
+        targets = ["ISO2", "ISO3", "name_zh", "UNcode"]
+        result = self.converter.convert_many("CHN", targets)
+        assert result == {
+            "ISO2": "CN",
+            "ISO3": "CHN",
+            "name_zh": "中国",
+            "UNcode": 156,
+        }
+
+        result = self.converter.convert_many(
+            ["US", "ZZ"], ["ISO3", "name_zh"], not_found="未知"
+        )
+        assert result == [
+            {"ISO3": "USA", "name_zh": "美国"},
+            {"ISO3": "未知", "name_zh": "未知"},
+        ]
+
+        # 数据帧一次连接取出多个目标列
+        df = pl.DataFrame({"name": ["China", "japan", None]})
+        result = self.converter.convert_frame(
+            df, "name", target=["ISO3", "name_zh"], use_regex=True, alias=["a", "b"]
+        )
+        assert result.columns == ["name", "a", "b"]
+        assert result["a"].to_list() == ["CHN", "JPN", None]
+        assert result["b"].to_list() == ["中国", "日本", None]
+        with pytest.raises(ValueError):
+            self.converter.convert_frame(df, "name", target=["ISO3"], alias=["a", "b"])
+
+    def test_enrich(self, tmp_path):
+        """测试惰性追加国家信息，支持流式执行和 sink_parquet"""
+        lf = pl.LazyFrame({"iso3": ["CHN", "USA", "XYZ"] * 100})
+        result = self.converter.enrich(lf, "iso3", ["ISO2", "name_zh"])
+        assert isinstance(result, pl.LazyFrame)
+
+        collected = result.collect(engine="streaming")
+        assert collected.columns == ["iso3", "ISO2", "name_zh"]
+        assert collected["ISO2"].to_list()[:3] == ["CN", "US", None]
+
+        path = tmp_path / "enriched.parquet"
+        self.converter.enrich(
+            pl.LazyFrame({"name": ["China", "japan"]}),
+            "name",
+            "ISO3",
+            use_regex=True,
+        ).sink_parquet(path)
+        assert pl.read_parquet(path)["ISO3"].to_list() == ["CHN", "JPN"]
+
+    def test_fuzzy_match(self):
+        """测试容错的模糊匹配"""
+        value, score = self.converter.fuzzy_match("Untied States of America")
+        assert value == "USA"
+        assert 0.5 < score < 1
+        assert self.converter.fuzzy_match("China") == ("CHN", 1.0)
+        assert self.converter.fuzzy_match("Germny", target="name_zh")[0] == "德国"
+
+        result = self.converter.fuzzy_match(["Rusia", "zzzz", None], not_found="未知")
+        assert [value for value, _ in result] == ["RUS", "未知", "未知"]
+
+        df = pl.DataFrame({"name": ["Chinna", "Japn", "qqq"]})
+        result = self.converter.fuzzy_match_frame(df, "name", not_found="未知")
+        assert result.columns == ["name", "ISO3", "ISO3_score"]
+        assert result["ISO3"].to_list() == ["CHN", "JPN", "未知"]
+        lazy = self.converter.fuzzy_match_frame(df.lazy(), "name", alias="code")
+        assert lazy.collect()["code"].to_list() == ["CHN", "JPN", None]
+
+    def test_additional_data(self):
+        """测试额外数据合并"""
+        converter = CountryCode(
+            {
+                "ISO3": ["CHN", "USA", "ZZA"],
+                "region_code": ["AS01", "NA01", "EU99"],
+                "name_zh": [None, None, "测试地区"],
+            }
+        )
+        assert converter.convert("AS01", source="region_code") == "中国"
+        assert converter.convert("ZZA", source="ISO3", target="region_code") == "EU99"
+        assert converter.convert("EU99", source="region_code") == "测试地区"
+        assert "region_code" in converter.all_valid_class
+
+        # 冲突检测
+        with pytest.raises(ValueError):
+            CountryCode({"ISO3": ["CHN"], "name_zh": ["美国"]})
+        with pytest.raises(ValueError):
+            CountryCode({"ISO3": ["CHN"], "ISO2": ["US"]})
+        with pytest.raises(ValueError):
+            CountryCode({"region_code": ["AS01"]})
+
     def test_get_method(self):
         """测试get_方法"""
         result = self.converter.get_("ISO2")
@@ -144,6 +412,31 @@ class TestCountryConvertFunction:
         assert result == "中国"
 
 
+class TestReferenceArtifact:
+    """测试代码表 Arrow IPC 文件"""
+
+    def test_build_reference_artifact(self, tmp_path):
+        """测试生成的文件内容与代码表一致且可内存映射读取"""
+        path = build_reference_artifact(tmp_path / "country.arrow")
+        assert path.exists()
+        frame = pl.read_ipc(path, memory_map=True)
+        assert frame.equals(CountryCode()._frame)
+
+    def test_artifact_freshness(self, tmp_path):
+        """测试按内容而不是修改时间判断 Arrow IPC 文件是否过期"""
+        source = tmp_path / "country.parquet"
+        source.write_bytes(codedata.read_bytes())
+        path = build_reference_artifact(tmp_path / "country.arrow")
+        # 安装时 parquet 可能比 Arrow 文件晚写入
+        os.utime(path, (0, 0))
+        assert _artifact_is_current(path, source)
+
+        pl.read_parquet(source).head(1).write_parquet(source)
+        os.utime(source, (0, 0))
+        assert not _artifact_is_current(path, source)
+        assert not _artifact_is_current(tmp_path / "missing.arrow", source)
+
+
 class TestIsDataContainer:
     """测试is_data_container函数"""
 
@@ -0,0 +1,673 @@
+"""
+测试 db 模块的压缩包导入功能
+"""
+
+import datetime
+import json
+import time
+import zipfile
+
+import duckdb
+import polars as pl
+import pytest
+
+import simtoolsz.db as db
+from simtoolsz.db import (
+    MANIFEST_TABLE,
+    SCHEMA_CACHE_TABLE,
+    SOURCE_COLUMN,
+    bulk_load,
+    multizip2db,
+    special2db,
+    zip2db,
+    zip2parquet,
+)
+
+
+@pytest.fixture
+def sample_zip(tmp_path):
+    """创建包含 CSV、JSON、Parquet 文件的测试压缩包"""
+    parquet_file = tmp_path / "categories.parquet"
+    pl.DataFrame({"category": ["X", "Y"], "value": [1.5, 2.5]}).write_parquet(
+        parquet_file
+    )
+    zip_file = tmp_path / "data.zip"
+    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("users.csv", "name,age\nAlice,25\nBob,30\n")
+        zf.writestr(
+            "orders.json",
+            json.dumps([{"id": 1, "status": "active"}, {"id": 2, "status": "done"}]),
+        )
+        zf.writestr("events.json", '{"id": 1}\n{"id": 2}\n{"id": 3}\n')
+        zf.write(parquet_file, "categories.parquet")
+        zf.writestr("nested/ignored.csv", "a\n1\n")
+    return zip_file
+
+
+_XLSX_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def write_xlsx(path, rows):
+    """按行写出最小的 XLSX 工作簿，rows 为 [[单元格 XML, ...], ...]"""
+    sheet = "".join(
+        f'<row r="{i}">{"".join(cells)}</row>' for i, cells in enumerate(rows, 1)
+    )
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{_XLSX_MAIN}" xmlns:r="{_XLSX_REL}"><sheets>'
+            '<sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        zf.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'relationships"><Relationship Id="rId1" Target="worksheets/sheet1.xml"/>'
+            "</Relationships>",
+        )
+        zf.writestr(
+            "xl/sharedStrings.xml",
+            f'<sst xmlns="{_XLSX_MAIN}"><si><t>name</t></si><si><t>Alice</t></si>'
+            "<si><r><t>Bo</t></r><r><t>b</t></r><rPh><t>x</t></rPh></si></sst>",
+        )
+        zf.writestr(
+            "xl/styles.xml",
+            f'<styleSheet xmlns="{_XLSX_MAIN}"><cellXfs count="2">'
+            '<xf numFmtId="0"/><xf numFmtId="14"/></cellXfs></styleSheet>',
+        )
+        zf.writestr(
+            "xl/worksheets/sheet1.xml",
+            f'<worksheet xmlns="{_XLSX_MAIN}"><sheetData>{sheet}</sheetData></worksheet>',
+        )
+
+
+@pytest.fixture
+def sample_xlsx(tmp_path):
+    """创建含字符串、整数、日期、小数与混合类型列的 XLSX 文件"""
+    path = tmp_path / "people.xlsx"
+    header = [
+        '<c r="A1" t="s"><v>0</v></c>',
+        '<c r="B1" t="inlineStr"><is><t>age</t></is></c>',
+        '<c r="C1" t="inlineStr"><is><t>joined</t></is></c>',
+        '<c r="D1" t="inlineStr"><is><t>score</t></is></c>',
+        '<c r="E1" t="inlineStr"><is><t>note</t></is></c>',
+    ]
+    alice = [
+        '<c r="A2" t="s"><v>1</v></c>',
+        '<c r="B2"><v>25</v></c>',
+        '<c r="C2" s="1"><v>45292</v></c>',
+        '<c r="D2"><v>1</v></c>',
+        '<c r="E2" t="inlineStr"><is><t>ok</t></is></c>',
+    ]
+    bob = [
+        '<c r="A3" t="s"><v>2</v></c>',
+        '<c r="C3" s="1"><v>45292.5</v></c>',
+        '<c r="D3"><v>2.5</v></c>',
+        '<c r="E3" t="b"><v>1</v></c>',
+    ]
+    write_xlsx(path, [header, alice, bob])
+    return path
+
+
+class TestZip2db:
+    """测试zip2db函数"""
+
+    def test_extract(self, sample_zip, tmp_path):
+        """测试解压后导入"""
+        con = zip2db(sample_zip, tmp_path / "out.db")
+        tables = {t for (t,) in con.execute("SHOW TABLES").fetchall()}
+        assert tables == {"users", "orders", "events", "categories"}
+        con.close()
+
+    def test_stream(self, sample_zip, tmp_path, monkeypatch):
+        """测试不解压、直接流式导入"""
+        monkeypatch.setattr(
+            zipfile.ZipFile,
+            "extractall",
+            lambda *args, **kwargs: pytest.fail("流式模式不应解压"),
+        )
+        con = zip2db(sample_zip, tmp_path / "out.db", stream=True)
+        tables = {t for (t,) in con.execute("SHOW TABLES").fetchall()}
+        assert tables == {"users", "orders", "events", "categories"}
+        assert con.execute("SELECT * FROM users ORDER BY age").fetchall() == [
+            ("Alice", 25),
+            ("Bob", 30),
+        ]
+        assert con.execute("SELECT count(*) FROM events").fetchone() == (3,)
+        assert con.execute("SELECT sum(value) FROM categories").fetchone() == (4.0,)
+        con.close()
+
+        con = zip2db(
+            sample_zip, ":memory:", filename="users.csv", table="用户", stream=True
+        )
+        assert con.execute("SHOW TABLES").fetchall() == [("用户",)]
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_workers(self, sample_zip, tmp_path, stream):
+        """测试多线程并发导入与依次导入结果一致"""
+        con = zip2db(sample_zip, tmp_path / "out.db", stream=stream, workers=4)
+        tables = {t for (t,) in con.execute("SHOW TABLES").fetchall()}
+        assert tables == {"users", "orders", "events", "categories"}
+        assert con.execute("SELECT count(*) FROM orders").fetchone() == (2,)
+        con.close()
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_workers_same_table(self, tmp_path, stream, capsys):
+        """测试写入同一张表的文件并发导入时按顺序执行，结果与依次导入一致"""
+        zip_file = tmp_path / "dup.zip"
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            for i in range(8):
+                zf.writestr(f"t{i}.csv", f"v\n{i}\n")
+                zf.writestr(f"T{i}.json", f'{{"v": {i + 100}}}\n')
+        expected = zip2db(zip_file, ":memory:", stream=stream)
+        con = zip2db(zip_file, ":memory:", stream=stream, workers=4)
+        query = "SELECT * FROM t3"
+        assert con.execute(query).fetchall() == expected.execute(query).fetchall()
+        assert "conflict" not in capsys.readouterr().out
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_xlsx(self, sample_xlsx, tmp_path, stream):
+        """测试分块解析 XLSX，推断列类型，不依赖 spatial 扩展"""
+        zip_file = tmp_path / "people.zip"
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.write(sample_xlsx, "people.xlsx")
+        con = zip2db(zip_file, ":memory:", stream=stream, chunk_size=1)
+        assert con.execute("SELECT * FROM people ORDER BY name").fetchall() == [
+            ("Alice", 25, datetime.datetime(2024, 1, 1), 1.0, "ok"),
+            ("Bob", None, datetime.datetime(2024, 1, 1, 12), 2.5, "TRUE"),
+        ]
+        assert (
+            con.execute(
+                "SELECT extension_name FROM duckdb_extensions() "
+                "WHERE extension_name = 'spatial' AND loaded"
+            ).fetchall()
+            == []
+        )
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_xlsx_options(self, sample_xlsx, tmp_path, stream, capsys):
+        """测试 XLSX 专用参数不会传给同一压缩包中其他格式的读取函数"""
+        zip_file = tmp_path / "mixed.zip"
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.write(sample_xlsx, "people.xlsx")
+            zf.writestr("users.csv", "name;age\nAlice;25\n")
+        con = zip2db(
+            zip_file, ":memory:", stream=stream, sheet="Sheet1", chunk_size=1, delim=";"
+        )
+        assert "出错" not in capsys.readouterr().out
+        assert con.execute("SELECT count(*) FROM people").fetchone() == (2,)
+        assert con.execute("SELECT * FROM users").fetchall() == [("Alice", 25)]
+
+        con = multizip2db(
+            [zip_file],
+            ["people.xlsx", "users.csv"],
+            bulk=True,
+            sheet="Sheet1",
+            chunk_size=1,
+            delim=";",
+        )
+        assert "出错" not in capsys.readouterr().out
+        assert con.execute("SELECT count(*) FROM people").fetchone() == (2,)
+        assert con.execute("SELECT name, age FROM users").fetchall() == [("Alice", 25)]
+
+    def test_xlsx_chunks(self, sample_xlsx):
+        """测试按 chunk_size 分批，header=False 时使用默认列名"""
+        reader = db._xlsx_reader(sample_xlsx, chunk_size=1)
+        assert [batch.num_rows for batch in reader] == [1, 1]
+        table = db._xlsx_reader(sample_xlsx, header=False).read_all()
+        assert table.column_names == [f"column{i}" for i in range(5)]
+        assert table.num_rows == 3
+        with pytest.raises(ValueError, match="工作表不存在"):
+            db._xlsx_reader(sample_xlsx, sheet="missing")
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_incremental(self, sample_zip, tmp_path, stream):
+        """测试增量导入只重新导入新增或变化的成员"""
+        db_file = tmp_path / "out.db"
+        zip2db(sample_zip, db_file, stream=stream, incremental=True).close()
+
+        con = zip2db(sample_zip, db_file, stream=stream, incremental=True)
+        assert con.execute(
+            f"SELECT count(*), count(DISTINCT loaded_at) FROM {MANIFEST_TABLE}"
+        ).fetchone() == (4, 1)
+        con.close()
+
+        # 目标表被删除后，清单中的记录不再使其跳过
+        zip2db(sample_zip, db_file, stream=stream, incremental=True).execute(
+            "DROP TABLE users"
+        ).close()
+        con = zip2db(sample_zip, db_file, stream=stream, incremental=True)
+        assert con.execute("SELECT count(*) FROM users").fetchone() == (2,)
+        con.close()
+
+        # 重写压缩包：users.csv 内容变化，其余成员原样保留
+        with zipfile.ZipFile(sample_zip) as zf:
+            members = {
+                info: zf.read(info)
+                for info in zf.infolist()
+                if info.filename != "users.csv"
+            }
+        with zipfile.ZipFile(sample_zip, "w") as zf:
+            for info, data in members.items():
+                zf.writestr(info, data)
+            zf.writestr("users.csv", "name,age\nAlice,25\nBob,30\nCarol,35\n")
+
+        con = zip2db(sample_zip, db_file, stream=stream, incremental=True)
+        assert con.execute("SELECT count(*) FROM users").fetchone() == (3,)
+        reloaded = con.execute(
+            f"SELECT member FROM {MANIFEST_TABLE} "
+            f"WHERE loaded_at = (SELECT max(loaded_at) FROM {MANIFEST_TABLE})"
+        ).fetchall()
+        assert reloaded == [("users.csv",)]
+        con.close()
+
+    def test_typed_options(self, tmp_path):
+        """测试读取参数按类型传递，可显式给出列和类型"""
+        zip_file = tmp_path / "raw.zip"
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.writestr("it's.csv", "1,007\n2,008\n")
+        con = zip2db(
+            zip_file,
+            ":memory:",
+            header=False,
+            sample_size=-1,
+            columns={"id": "BIGINT", "code": "VARCHAR"},
+        )
+        assert con.execute("DESCRIBE its").fetchall()[0][:2] == ("id", "BIGINT")
+        assert con.execute("SELECT * FROM its ORDER BY id").fetchall() == [
+            (1, "007"),
+            (2, "008"),
+        ]
+
+    def test_non_finite_literal(self):
+        """测试 NaN 与无穷大转换为合法的 DOUBLE 字面量"""
+        con = duckdb.connect()
+        values = [float("nan"), float("inf"), float("-inf"), 1.5]
+        row = con.execute(f"SELECT {db._sql_literal(values)}").fetchone()[0]
+        assert row[1:] == [float("inf"), float("-inf"), 1.5]
+        assert row[0] != row[0]
+
+    def test_schema_cache(self, tmp_path, monkeypatch, capsys):
+        """测试布局相同的文件复用探测结果，缓存失效时回退到自动探测"""
+
+        def daily_zip(day, rows):
+            zip_file = tmp_path / f"daily{day}.zip"
+            with zipfile.ZipFile(zip_file, "w") as zf:
+                zf.writestr(f"sales_2024010{day}.csv", "id;date;amount\n" + rows)
+            return zip_file
+
+        db_file = tmp_path / "out.db"
+        con = zip2db(daily_zip(1, "1;03/01/2024;1.5\n"), db_file, schema_cache=True)
+        assert con.execute(f"SELECT pattern FROM {SCHEMA_CACHE_TABLE}").fetchall() == [
+            ("sales_*.csv",)
+        ]
+        con.close()
+
+        sniff = db._sniff_schema
+        monkeypatch.setattr(
+            db, "_sniff_schema", lambda *args: pytest.fail("命中缓存时不应探测")
+        )
+        con = zip2db(daily_zip(2, "2;13/01/2024;2.5\n"), db_file, schema_cache=True)
+        assert con.execute("SELECT * FROM sales_20240102").fetchall() == [
+            (2, datetime.date(2024, 1, 13), 2.5)
+        ]
+        con.close()
+
+        # 列类型变化，按缓存读取失败后回退到自动探测并重新缓存
+        monkeypatch.setattr(db, "_sniff_schema", sniff)
+        # 试读在事务之外进行，事务不会中止，无需逐个文件重新导入
+        capsys.readouterr()
+        con = zip2db(daily_zip(3, "A3;14/01/2024;3.5\n"), db_file, schema_cache=True)
+        assert capsys.readouterr().out.count("改用自动探测") == 1
+        assert con.execute("SELECT id FROM sales_20240103").fetchall() == [("A3",)]
+        assert con.execute(f"SELECT count(*) FROM {SCHEMA_CACHE_TABLE}").fetchone() == (
+            0,
+        )
+        con.close()
+        con = zip2db(daily_zip(4, "A4;15/01/2024;4.5\n"), db_file, schema_cache=True)
+        assert con.execute(f"SELECT count(*) FROM {SCHEMA_CACHE_TABLE}").fetchone() == (
+            1,
+        )
+        con.close()
+
+    def test_transaction_fallback(self, tmp_path):
+        """测试同一压缩包中某个文件出错时，其余文件仍然导入"""
+        zip_file = tmp_path / "mixed.zip"
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.writestr("good.csv", "a\n1\n")
+            zf.writestr("bad.parquet", "not a parquet file")
+            zf.writestr("more.csv", "b\n2\n")
+        con = zip2db(zip_file, tmp_path / "out.db")
+        tables = {t for (t,) in con.execute("SHOW TABLES").fetchall()}
+        assert tables == {"good", "more"}
+        con.close()
+
+
+class TestZip2parquet:
+    """测试zip2parquet函数"""
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_convert(self, sample_zip, tmp_path, stream):
+        """测试每个成员转换为一个Parquet文件"""
+        out = tmp_path / "parquet"
+        files = zip2parquet(sample_zip, out, stream=stream)
+        assert sorted(f.name for f in files) == [
+            "categories.parquet",
+            "events.parquet",
+            "orders.parquet",
+            "users.parquet",
+        ]
+        users = pl.read_parquet(out / "users.parquet").sort("age")
+        assert users.to_dicts() == [
+            {"name": "Alice", "age": 25},
+            {"name": "Bob", "age": 30},
+        ]
+
+    def test_partition(self, tmp_path):
+        """测试分区输出、压缩算法与行组大小"""
+        zip_file = tmp_path / "sales.zip"
+        rows = "".join(f"{i},{2023 + i % 2},{i * 0.5}\n" for i in range(10_000))
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.writestr("sales.tsv", ("id,year,amount\n" + rows).replace(",", "\t"))
+        (target,) = zip2parquet(
+            zip_file,
+            tmp_path / "out",
+            partition_by="year",
+            compression="snappy",
+            row_group_size=2048,
+        )
+        assert sorted(p.name for p in target.iterdir()) == ["year=2023", "year=2024"]
+        con = duckdb.connect()
+        pattern = (target / "**" / "*.parquet").as_posix()
+        assert con.execute(
+            f"SELECT count(*), sum(amount) FROM read_parquet('{pattern}', "
+            "hive_partitioning=true) WHERE year = 2024"
+        ).fetchone() == (5000, sum(i * 0.5 for i in range(1, 10_000, 2)))
+        meta = con.execute(
+            "SELECT count(DISTINCT row_group_id), any_value(compression) "
+            f"FROM parquet_metadata('{pattern}')"
+        ).fetchone()
+        assert meta[0] > 1 and meta[1] == "SNAPPY"
+
+    def test_duplicate_target(self, tmp_path):
+        """测试文件名主干相同的成员不会互相覆盖"""
+        zip_file = tmp_path / "dup.zip"
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.writestr("a.csv", "x\n1\n")
+            zf.writestr("a.json", '[{"x": 2}]')
+        with pytest.raises(ValueError, match="a.csv, a.json"):
+            zip2parquet(zip_file, tmp_path / "out")
+        assert not (tmp_path / "out").exists()
+
+
+class TestBulkLoad:
+    """测试bulk_load上下文"""
+
+    def test_shared_connection(self, sample_zip, tmp_path):
+        """测试在同一连接上导入多个压缩包，退出后恢复设置"""
+        con = duckdb.connect(str(tmp_path / "out.db"))
+        before = con.execute(
+            "SELECT current_setting('checkpoint_threshold'), "
+            "current_setting('preserve_insertion_order')"
+        ).fetchone()
+        with bulk_load(con, memory_limit="1GB") as loading:
+            assert loading.execute(
+                "SELECT current_setting('preserve_insertion_order')"
+            ).fetchone() == (False,)
+            assert zip2db(sample_zip, loading, filename="users.csv") is con
+            multizip2db([sample_zip], "events.json", loading)
+        assert (
+            con.execute(
+                "SELECT current_setting('checkpoint_threshold'), "
+                "current_setting('preserve_insertion_order')"
+            ).fetchone()
+            == before
+        )
+        tables = {t for (t,) in con.execute("SHOW TABLES").fetchall()}
+        assert tables == {"users", "events"}
+        con.close()
+
+    def test_restore_defaults(self):
+        """测试默认设置以 RESET 恢复，不写回取整后的显示值"""
+
+        class Recorder:
+            def __init__(self, con):
+                self.con, self.statements = con, []
+
+            def execute(self, sql, *args):
+                self.statements.append(sql)
+                return self.con.execute(sql, *args)
+
+        con = Recorder(duckdb.connect())
+        con.execute("SET checkpoint_threshold = '3GB'")
+        with bulk_load(con, memory_limit="1GB"):
+            pass
+        assert "RESET memory_limit" in con.statements
+        assert "RESET preserve_insertion_order" in con.statements
+        # 已修改的设置按显示值写回
+        assert "SET checkpoint_threshold = '2.7 GiB'" in con.statements
+
+
+class TestSpecial2db:
+    """测试special2db函数"""
+
+    def test_workers(self, tmp_path):
+        """测试目录中的多个文件并发导入"""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        for i in range(6):
+            (data_dir / f"part{i}.tsv").write_text(
+                "id\tvalue\n" + "".join(f"{j}\t{i}\n" for j in range(10)),
+                encoding="utf-8",
+            )
+        con = special2db(data_dir, tmp_path / "out.db", workers=3)
+        tables = sorted(t for (t,) in con.execute("SHOW TABLES").fetchall())
+        assert tables == [f"part{i}" for i in range(6)]
+        assert con.execute("SELECT sum(value) FROM part5").fetchone() == (50,)
+        con.close()
+
+
+class TestMultizip2db:
+    """测试multizip2db函数"""
+
+    @pytest.fixture
+    def zips(self, tmp_path):
+        """创建三个包含同名文件的压缩包，最后一个多出一列"""
+        paths = []
+        for i in range(3):
+            zip_file = tmp_path / f"part{i}.zip"
+            with zipfile.ZipFile(zip_file, "w") as zf:
+                header = "name,age,city" if i == 2 else "name,age"
+                extra = ",Beijing" if i == 2 else ""
+                zf.writestr("users.csv", f"{header}\nuser{i},{20 + i}{extra}\n")
+                zf.writestr("nested/users.csv", "name\nignored\n")
+            paths.append(zip_file)
+        return paths
+
+    def test_per_file(self, zips):
+        """测试逐个文件导入"""
+        con = multizip2db(zips[:2], "users.csv")
+        assert con.execute("SELECT count(*) FROM users").fetchone() == (2,)
+
+    def test_bulk(self, zips):
+        """测试一次多文件读取，按列名合并并记录来源"""
+        con = multizip2db(zips, "*.csv", table="combined", bulk=True)
+        rows = con.execute(
+            f"SELECT name, city, {SOURCE_COLUMN} FROM combined ORDER BY name"
+        ).fetchall()
+        assert rows == [
+            ("user0", None, f"{zips[0].resolve()}/users.csv"),
+            ("user1", None, f"{zips[1].resolve()}/users.csv"),
+            ("user2", "Beijing", f"{zips[2].resolve()}/users.csv"),
+        ]
+
+    def test_bulk_filename_column(self, tmp_path):
+        """测试数据中已有 filename 列时批量导入不冲突"""
+        zip_file = tmp_path / "docs.zip"
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.writestr("docs.csv", "filename,size\na.txt,1\nb.txt,2\n")
+        con = multizip2db([zip_file], "docs.csv", bulk=True)
+        source = f"{zip_file.resolve()}/docs.csv"
+        assert con.execute(
+            f"SELECT filename, {SOURCE_COLUMN} FROM docs ORDER BY size"
+        ).fetchall() == [("a.txt", source), ("b.txt", source)]
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_incremental(self, zips, tmp_path, bulk):
+        """测试重复运行不会重复导入，新增的压缩包只追加其数据"""
+        db_file = tmp_path / "out.db"
+        multizip2db(zips[:2], "users.csv", db_file, bulk=bulk, incremental=True).close()
+        multizip2db(zips[:2], "users.csv", db_file, bulk=bulk, incremental=True).close()
+        extra = tmp_path / "part3.zip"
+        with zipfile.ZipFile(extra, "w") as zf:
+            zf.writestr("users.csv", "name,age\nuser3,23\n")
+        con = multizip2db(
+            [*zips[:2], extra], "users.csv", db_file, bulk=bulk, incremental=True
+        )
+        names = con.execute("SELECT name FROM users ORDER BY name").fetchall()
+        assert names == [("user0",), ("user1",), ("user3",)]
+        assert con.execute(f"SELECT count(*) FROM {MANIFEST_TABLE}").fetchone() == (3,)
+        con.close()
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_incremental_changed(self, tmp_path, bulk):
+        """测试成员变化时只替换该压缩包的旧数据，不同目录下的同名压缩包互不影响"""
+
+        def write(zip_file, rows):
+            zip_file.parent.mkdir(exist_ok=True)
+            with zipfile.ZipFile(zip_file, "w") as zf:
+                zf.writestr("users.csv", "name,age\n" + rows)
+
+        first, second = tmp_path / "a" / "data.zip", tmp_path / "b" / "data.zip"
+        write(first, "a1,1\n")
+        write(second, "b1,2\n")
+        db_file = tmp_path / "out.db"
+        zips = [first, second]
+        multizip2db(zips, "users.csv", db_file, bulk=bulk, incremental=True).close()
+
+        write(first, "a2,3\na3,4\n")
+        con = multizip2db(zips, "users.csv", db_file, bulk=bulk, incremental=True)
+        names = con.execute("SELECT name FROM users ORDER BY name").fetchall()
+        assert names == [("a2",), ("a3",), ("b1",)]
+        con.close()
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_incremental_then_full(self, zips, tmp_path, bulk, capsys):
+        """测试增量导入建立的表（带来源列）可以继续以非增量方式追加"""
+        db_file = tmp_path / "out.db"
+        multizip2db(zips[:1], "users.csv", db_file, bulk=bulk, incremental=True).close()
+        con = multizip2db(zips[1:2], "users.csv", db_file, bulk=bulk)
+        assert "出错" not in capsys.readouterr().out
+        names = con.execute("SELECT name FROM users ORDER BY name").fetchall()
+        assert names == [("user0",), ("user1",)]
+        con.close()
+
+    def test_incremental_dropped(self, zips, tmp_path):
+        """测试目标表被删除后重新运行会重新导入"""
+        db_file = tmp_path / "out.db"
+        multizip2db(zips[:2], "users.csv", db_file, incremental=True).execute(
+            "DROP TABLE users"
+        ).close()
+        con = multizip2db(zips[:2], "users.csv", db_file, incremental=True)
+        assert con.execute("SELECT count(*) FROM users").fetchone() == (2,)
+        con.close()
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_schema_cache(self, zips, bulk):
+        """测试合并导入时复用探测结果"""
+        con = multizip2db(zips[:2], "users.csv", bulk=bulk, schema_cache=True)
+        assert con.execute("SELECT sum(age) FROM users").fetchone() == (41,)
+        assert con.execute(f"SELECT count(*) FROM {SCHEMA_CACHE_TABLE}").fetchone() == (
+            1,
+        )
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_prefetch(self, zips, bulk):
+        """测试并发解压与依次解压的结果一致"""
+        con = multizip2db(zips[:2], "users.csv", bulk=bulk, prefetch=4)
+        expected = multizip2db(zips[:2], "users.csv", bulk=bulk)
+        query = "SELECT * FROM users ORDER BY ALL"
+        assert con.execute(query).fetchall() == expected.execute(query).fetchall()
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_prefetch_nested(self, tmp_path, bulk, capsys):
+        """测试并发解压同一目录下的多个成员"""
+        zips = []
+        for i in range(2):
+            zip_file = tmp_path / f"nested{i}.zip"
+            with zipfile.ZipFile(zip_file, "w") as zf:
+                for d in range(4):
+                    for k in range(8):
+                        zf.writestr(f"{d}/sub/u{k}.csv", f"name,age\nuser{k},{k}\n")
+            zips.append(zip_file)
+        con = multizip2db(zips, "*/sub/*.csv", table="u", bulk=bulk, prefetch=16)
+        assert "出错" not in capsys.readouterr().out
+        assert con.execute("SELECT count(*), sum(age) FROM u").fetchone() == (64, 224)
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_xlsx(self, sample_xlsx, tmp_path, bulk):
+        """测试合并导入多个压缩包中的 XLSX"""
+        zips = []
+        for i in range(2):
+            zip_file = tmp_path / f"book{i}.zip"
+            with zipfile.ZipFile(zip_file, "w") as zf:
+                zf.write(sample_xlsx, "people.xlsx")
+            zips.append(zip_file)
+        con = multizip2db(zips, "*.xlsx", bulk=bulk)
+        assert con.execute("SELECT count(*), sum(age) FROM people").fetchone() == (
+            4,
+            50,
+        )
+
+    def test_bulk_existing_table(self, zips, tmp_path, capsys):
+        """测试批量模式追加到默认模式建立、没有来源列的表"""
+        db_file = tmp_path / "out.db"
+        multizip2db(zips[:1], "users.csv", db_file).close()
+        con = multizip2db(zips[1:2], "users.csv", db_file, bulk=True)
+        assert "出错" not in capsys.readouterr().out
+        rows = con.execute(
+            f"SELECT name, {SOURCE_COLUMN} FROM users ORDER BY name"
+        ).fetchall()
+        assert rows == [("user0", None), ("user1", f"{zips[1].resolve()}/users.csv")]
+        con.close()
+
+    def test_bulk_rollback(self, sample_xlsx, tmp_path, capsys):
+        """测试批量模式中某个文件出错时整表回滚，重复运行不会累积部分数据"""
+        good, bad = tmp_path / "good.zip", tmp_path / "bad.zip"
+        with zipfile.ZipFile(good, "w") as zf:
+            zf.write(sample_xlsx, "people.xlsx")
+        with zipfile.ZipFile(bad, "w") as zf:
+            zf.writestr("people.xlsx", b"not a workbook")
+        db_file = tmp_path / "out.db"
+        for _ in range(3):
+            multizip2db(
+                [good, bad], "*.xlsx", db_file, bulk=True, incremental=True
+            ).close()
+        assert "已回滚" in capsys.readouterr().out
+        con = duckdb.connect(str(db_file))
+        tables = {t for (t,) in con.execute("SHOW TABLES").fetchall()}
+        assert "people" not in tables
+        assert con.execute(f"SELECT count(*) FROM {MANIFEST_TABLE}").fetchone() == (0,)
+        con.close()
+
+    def test_zip_extractor(self, tmp_path):
+        """测试解压到目标目录内，去掉成员名中的 .. 等路径段"""
+        zip_file = tmp_path / "paths.zip"
+        with zipfile.ZipFile(zip_file, "w") as zf:
+            zf.writestr("../a/./b.csv", "x")
+        with zipfile.ZipFile(zip_file) as zf:
+            member = zf.infolist()[0]
+        with db._zip_extractor() as extract:
+            path = extract((zip_file, member, tmp_path / "out"))
+        assert path == tmp_path / "out" / "a" / "b.csv"
+        assert path.read_text() == "x"
+
+    def test_prefetch_backpressure(self):
+        """测试预取的项数受限，结果保持顺序"""
+        started = []
+        futures = db._prefetch(list(range(20)), lambda i: started.append(i) or i, 2)
+        first = next(futures)
+        assert first.result() == 0
+        time.sleep(0.05)
+        assert len(started) <= 3
+        assert [f.result() for f in futures] == list(range(1, 20))